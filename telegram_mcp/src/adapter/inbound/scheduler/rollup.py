@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+from src.application.port.input.rollup import DailyRollupUseCase
+from src.infrastructure.telegram_client import TelegramClient
+
+logger = logging.getLogger(__name__)
+
+
+async def run_daily_rollup_job(
+    daily_rollup_use_case: DailyRollupUseCase,
+    telegram_client: TelegramClient,
+    channel_ids: list[str],
+    interval: int,
+) -> None:
+    """
+    일간 집계 갱신을 interval초마다 실행하는 백그라운드 작업
+
+    KST 일자가 마감된 뒤 첫 실행에서 직전 일자의 집계가 계산되고, 이후 실행에서는 늦게 도착한 수정/삭제가 반영된다.
+    한 번의 실행 동안 텔레그램 연결을 유지해 일자별 조회마다 연결/해제하지 않는다.
+
+    Args:
+        daily_rollup_use_case: 일간 집계 Use Case
+        telegram_client: 텔레그램 클라이언트
+        channel_ids: 집계할 채널 username (@python) 또는 ID 목록
+        interval: 실행 간격 (초)
+    """
+    while True:
+        try:
+            async with telegram_client:
+                await daily_rollup_use_case.refresh_daily_rollups(channel_ids)
+        except Exception:
+            logger.exception("일간 집계 갱신 실패")
+        await asyncio.sleep(interval)
@@ -0,0 +1,43 @@
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from src.adapter.inbound.web.routes.message import ErrorResponse
+from src.infrastructure.exception import (
+    InvalidDateRangeError,
+    InvalidSyncTokenError,
+    MessageNotFoundError,
+    SyncTokenExpiredError,
+)
+
+# 예외별 HTTP 상태 코드
+EXCEPTION_STATUS_CODES: dict[type[Exception], int] = {
+    MessageNotFoundError: status.HTTP_404_NOT_FOUND,
+    InvalidSyncTokenError: status.HTTP_400_BAD_REQUEST,
+    SyncTokenExpiredError: status.HTTP_410_GONE,
+    InvalidDateRangeError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+async def handle_exception(request: Request, exc: Exception) -> JSONResponse:
+    """
+    예외를 상태 코드에 맞는 ErrorResponse로 변환
+
+    Args:
+        request: 요청
+        exc: 처리할 예외 (EXCEPTION_STATUS_CODES에 등록된 예외)
+
+    Returns:
+        JSONResponse: 에러 응답
+    """
+    error = ErrorResponse(error=type(exc).__name__, message=str(exc))
+    return JSONResponse(status_code=EXCEPTION_STATUS_CODES[type(exc)], content=error.model_dump())
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    EXCEPTION_STATUS_CODES에 등록된 예외 핸들러를 앱에 등록
+
+    Args:
+        app: FastAPI 앱
+    """
+    for exception in EXCEPTION_STATUS_CODES:
+        app.add_exception_handler(exception, handle_exception)
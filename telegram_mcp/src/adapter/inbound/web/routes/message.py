@@ -2,13 +2,35 @@ from datetime import date, datetime
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel, Field
 from src.application.port.input.message import MessageRetrievalUseCase
+from src.application.port.input.sync import MessageSyncUseCase
+from src.domain.entities.message import MessageField
 from src.infrastructure.container import Container
 
 router = APIRouter(prefix="/message", tags=["message"])
 
+FieldsQuery = Annotated[
+    list[MessageField] | None,
+    Query(description="기본 필드 외에 추가로 조회할 필드 그룹 (요청한 필드만 응답에 포함)"),
+]
+DedupeQuery = Annotated[
+    bool, Query(description="유사 중복 메시지는 클러스터 대표(채널과 무관하게 처음 조회된 메시지)만 반환")
+]
+
+
+class LinkPreviewResponse(BaseModel):
+    """
+    링크 미리보기
+    """
+
+    url: str = Field(description="메시지에 포함된 URL", example="https://bit.ly/abc")
+    canonical_url: str = Field(description="정규화된 URL", example="https://bit.ly/abc")
+    final_url: str | None = Field(description="리다이렉트 이후 최종 URL", example="https://news.example.com/a")
+    title: str | None = Field(description="페이지 제목", example="삼성전자 3분기 실적 발표")
+    description: str | None = Field(description="페이지 설명", example="삼성전자가 3분기 실적을 발표했다.")
+
 
 class GetMessageResponse(BaseModel):
     """
@@ -18,8 +40,46 @@ class GetMessageResponse(BaseModel):
     id: int = Field(description="메시지 ID", example=1)
     message: str = Field(description="메시지", example="Hello, World!")
     ts: datetime = Field(description="메시지 타임스탬프", example="2025-01-01T00:00:00+09:00")
+    edit_ts: datetime | None = Field(
+        default=None, description="메시지 마지막 수정 타임스탬프", example="2025-01-01T00:10:00+09:00"
+    )
     peer_name: str = Field(description="채널 이름", example="python")
     peer_id: int = Field(description="채널 ID", example=1)
+    sender_id: int | None = Field(default=None, description="발신자 ID (fields=sender)", example=1)
+    sender_username: str | None = Field(default=None, description="발신자 username (fields=sender)", example="python")
+    sender_first_name: str | None = Field(default=None, description="발신자 이름 (fields=sender)", example="Guido")
+    forward_from_channel: str | None = Field(
+        default=None, description="전달 원본 채널 (fields=forward)", example="python_news"
+    )
+    forward_ts: datetime | None = Field(
+        default=None, description="전달 원본 타임스탬프 (fields=forward)", example="2025-01-01T00:00:00+09:00"
+    )
+    reply_to_message_id: int | None = Field(default=None, description="답장 대상 메시지 ID (fields=reply)", example=1)
+    media_type: str | None = Field(
+        default=None, description="미디어 종류: photo, video, audio, document (fields=media)", example="photo"
+    )
+    links: list[LinkPreviewResponse] | None = Field(default=None, description="링크 미리보기 (fields=links)")
+    cluster_id: int | None = Field(default=None, description="유사 중복 메시지 클러스터 ID", example=1)
+
+
+class GetMessageChangesResponse(BaseModel):
+    """
+    메시지 변경분 조회 응답
+    """
+
+    token: str = Field(description="다음 조회에 사용할 동기화 토큰", example="eyJjIjoxLCJwIjoxMDB9")
+    added: list[GetMessageResponse] = Field(description="추가된 메시지")
+    edited: list[GetMessageResponse] = Field(description="수정된 메시지")
+    deleted_ids: list[int] = Field(description="삭제된 메시지 ID", example=[1, 2])
+    has_more: bool = Field(description="남은 변경분 존재 여부", example=False)
+
+
+class GetMessageCountResponse(BaseModel):
+    """
+    메시지 수 추정 응답
+    """
+
+    estimated_count: int = Field(description="메시지 수 (삭제된 메시지를 포함할 수 있는 상한)", example=120)
 
 
 class ErrorResponse(BaseModel):
@@ -46,6 +106,7 @@ class ErrorResponse(BaseModel):
 @router.get(
     "/latest/{channel_id}",
     response_model=GetMessageResponse,
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_404_NOT_FOUND: {
@@ -58,17 +119,19 @@ class ErrorResponse(BaseModel):
 async def get_latest_message(
     channel_id: str,
     message_retrieval_use_case: Annotated[MessageRetrievalUseCase, Depends(Provide[Container.message_service])],
+    fields: FieldsQuery = None,
 ):
     """
     최신 메시지 조회
     """
-    message = await message_retrieval_use_case.get_latest_message(channel_id)
+    message = await message_retrieval_use_case.get_latest_message(channel_id, frozenset(fields or ()))
     return GetMessageResponse(**message.to_dict())
 
 
 @router.get(
     "/date/{channel_id}",
     response_model=list[GetMessageResponse],
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_404_NOT_FOUND: {
@@ -82,17 +145,38 @@ async def get_messages_by_date(
     channel_id: str,
     date: date,
     message_retrieval_use_case: Annotated[MessageRetrievalUseCase, Depends(Provide[Container.message_service])],
+    fields: FieldsQuery = None,
+    dedupe: DedupeQuery = False,
 ):
     """
     특정 날짜의 메시지 조회
     """
-    messages = await message_retrieval_use_case.get_messages_by_date(channel_id, date)
+    messages = await message_retrieval_use_case.get_messages_by_date(channel_id, date, frozenset(fields or ()), dedupe)
     return [GetMessageResponse(**message.to_dict()) for message in messages]
 
 
+@router.get(
+    "/count/{channel_id}",
+    response_model=GetMessageCountResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def estimate_message_count_by_date(
+    channel_id: str,
+    date: date,
+    message_retrieval_use_case: Annotated[MessageRetrievalUseCase, Depends(Provide[Container.message_service])],
+):
+    """
+    특정 날짜의 메시지 수 추정
+    """
+    estimated_count = await message_retrieval_use_case.estimate_message_count_by_date(channel_id, date)
+    return GetMessageCountResponse(estimated_count=estimated_count)
+
+
 @router.get(
     "/yesterday/{channel_id}",
     response_model=list[GetMessageResponse],
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_404_NOT_FOUND: {
@@ -105,9 +189,39 @@ async def get_messages_by_date(
 async def get_yesterday_messages(
     channel_id: str,
     message_retrieval_use_case: Annotated[MessageRetrievalUseCase, Depends(Provide[Container.message_service])],
+    fields: FieldsQuery = None,
+    dedupe: DedupeQuery = False,
 ):
     """
     어제의 메시지 조회
     """
-    messages = await message_retrieval_use_case.get_yesterday_messages(channel_id)
+    messages = await message_retrieval_use_case.get_yesterday_messages(channel_id, frozenset(fields or ()), dedupe)
     return [GetMessageResponse(**message.to_dict()) for message in messages]
+
+
+@router.get(
+    "/changes/{channel_id}",
+    response_model=GetMessageChangesResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "잘못된 동기화 토큰",
+        },
+        status.HTTP_410_GONE: {
+            "model": ErrorResponse,
+            "description": "만료된 동기화 토큰 (전체 재동기화 필요)",
+        },
+    },
+)
+@inject
+async def get_message_changes(
+    channel_id: str,
+    message_sync_use_case: Annotated[MessageSyncUseCase, Depends(Provide[Container.message_sync_service])],
+    token: str | None = None,
+):
+    """
+    동기화 토큰 이후 추가/수정/삭제된 메시지 조회
+    """
+    changes = await message_sync_use_case.get_changes(channel_id, token)
+    return GetMessageChangesResponse(**changes.to_dict())
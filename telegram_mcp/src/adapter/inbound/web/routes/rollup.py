@@ -0,0 +1,59 @@
+import datetime
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query, status
+from pydantic import BaseModel, Field
+from src.adapter.inbound.web.routes.message import ErrorResponse
+from src.application.port.input.rollup import DailyRollupUseCase
+from src.infrastructure.container import Container
+
+router = APIRouter(prefix="/rollup", tags=["rollup"])
+
+
+class RollupItemResponse(BaseModel):
+    """
+    집계 상위 항목
+    """
+
+    value: str = Field(description="링크 또는 티커", example="$TSLA")
+    count: int = Field(description="등장 횟수", example=3)
+
+
+class GetDailyRollupResponse(BaseModel):
+    """
+    일간 집계 조회 응답
+    """
+
+    channel_id: str = Field(description="채널 username 또는 ID", example="python")
+    date: datetime.date = Field(description="일자 (KST)", example="2025-01-01")
+    count: int = Field(description="메시지 수", example=120)
+    hourly_counts: list[int] = Field(description="KST 시간대별 메시지 수 (0~23시)")
+    top_links: list[RollupItemResponse] = Field(description="가장 많이 등장한 링크")
+    top_tickers: list[RollupItemResponse] = Field(description="가장 많이 언급된 티커 ($TSLA 형식)")
+    stale: bool = Field(description="최신 수정/삭제가 반영되지 않았을 수 있는 집계 여부", example=False)
+
+
+@router.get(
+    "/daily",
+    response_model=list[GetDailyRollupResponse],
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "잘못된 조회 기간",
+        },
+    },
+)
+@inject
+async def get_daily_rollups(
+    channel_ids: Annotated[list[str], Query(description="채널 username (@python) 또는 ID 목록")],
+    start_date: datetime.date,
+    end_date: datetime.date,
+    daily_rollup_use_case: Annotated[DailyRollupUseCase, Depends(Provide[Container.daily_rollup_service])],
+):
+    """
+    채널별 일간 집계 조회 (백그라운드 작업이 집계한 마감 일자만 포함)
+    """
+    rollups = await daily_rollup_use_case.get_daily_rollups(channel_ids, start_date, end_date)
+    return [GetDailyRollupResponse(**rollup.to_dict()) for rollup in rollups]
@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+import aiofiles
+
+
+class JsonFile:
+    """
+    JSON 파일 하나를 비동기로 읽고 쓰는 저장소
+    """
+
+    def __init__(self, path: str):
+        """
+        JsonFile 초기화
+        """
+        self.path = Path(path)
+
+    async def load(self) -> dict:
+        """
+        JSON 파일 읽기 (파일이 없으면 빈 딕셔너리)
+        """
+        if not self.path.exists():
+            return {}
+
+        async with aiofiles.open(self.path, encoding="utf-8") as f:
+            return json.loads(await f.read())
+
+    async def save(self, data: dict) -> None:
+        """
+        JSON 파일 쓰기
+
+        임시 파일에 쓴 뒤 교체하므로 쓰기 도중 중단되어도 기존 파일이 깨지지 않는다.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+
+        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        tmp_path.replace(self.path)
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime
+
+from src.adapter.outbound.file_storage.json_file import JsonFile
+from src.application.port.output.message_index import MessageIndexPort
+
+
+class JsonMessageIndexRepository(MessageIndexPort):
+    """
+    채널별 시간 경계 → 메시지 ID 인덱스를 JSON 파일에 저장하는 Repository
+
+    파일 형식: {채널 peer ID: {경계 시각 epoch 초: 메시지 ID}}
+    """
+
+    def __init__(self, path: str):
+        """
+        JsonMessageIndexRepository 초기화
+        """
+        self.file = JsonFile(path)
+        self._index: dict[str, dict[str, int]] | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_boundaries(self, peer_id: int, boundaries: list[datetime]) -> dict[datetime, int]:
+        """
+        경계 시각별 메시지 ID 조회
+
+        Args:
+            peer_id: 채널 peer ID (username과 ID 표기 모두 같은 값)
+            boundaries: 조회할 경계 시각 목록
+
+        Returns:
+            dict[datetime, int]: 인덱스에 기록된 경계 시각별 메시지 ID (기록되지 않은 경계는 제외)
+        """
+        channel_index = (await self._load()).get(str(peer_id), {})
+        return {
+            boundary: channel_index[key] for boundary in boundaries if (key := self._key(boundary)) in channel_index
+        }
+
+    async def record_boundaries(self, peer_id: int, boundaries: dict[datetime, int]) -> None:
+        """
+        경계 시각별 메시지 ID 기록 (새로 기록할 경계가 없으면 파일을 쓰지 않음)
+
+        Args:
+            peer_id: 채널 peer ID (username과 ID 표기 모두 같은 값)
+            boundaries: 경계 시각별 메시지 ID
+        """
+        async with self._lock:
+            index = await self._load()
+            channel_index = index.setdefault(str(peer_id), {})
+            updates = {self._key(boundary): message_id for boundary, message_id in boundaries.items()}
+
+            if all(channel_index.get(key) == message_id for key, message_id in updates.items()):
+                return
+
+            channel_index.update(updates)
+            await self.file.save(index)
+
+    async def _load(self) -> dict[str, dict[str, int]]:
+        """
+        인덱스 파일을 처음 사용할 때 한 번만 읽음
+        """
+        if self._index is None:
+            self._index = await self.file.load()
+        return self._index
+
+    @staticmethod
+    def _key(boundary: datetime) -> str:
+        """
+        경계 시각을 JSON 키(epoch 초)로 변환
+        """
+        return str(int(boundary.timestamp()))
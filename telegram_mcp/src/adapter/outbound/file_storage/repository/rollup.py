@@ -0,0 +1,105 @@
+import asyncio
+from datetime import date
+
+from src.adapter.outbound.file_storage.json_file import JsonFile
+from src.application.port.output.rollup import DailyRollupPort
+from src.domain.entities.rollup import DailyRollup
+
+
+class JsonDailyRollupRepository(DailyRollupPort):
+    """
+    채널별 일간 집계를 JSON 파일에 저장하는 Repository
+
+    파일 형식: {"rollups": {channel_id: {YYYY-MM-DD: 집계}}, "tokens": {channel_id: 동기화 토큰}}
+    """
+
+    def __init__(self, path: str):
+        """
+        JsonDailyRollupRepository 초기화
+        """
+        self.file = JsonFile(path)
+        self._data: dict | None = None
+        self._lock = asyncio.Lock()
+
+    async def find_by_channel_and_dates(self, channel_id: str, dates: list[date]) -> dict[date, DailyRollup]:
+        """
+        저장된 일간 집계 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            dates: 조회할 일자 목록
+
+        Returns:
+            dict[date, DailyRollup]: 저장된 일자별 집계 (저장되지 않은 일자는 제외)
+        """
+        channel_rollups = (await self._load())["rollups"].get(channel_id, {})
+        return {
+            day: DailyRollup.from_dict(channel_rollups[day.isoformat()])
+            for day in dates
+            if day.isoformat() in channel_rollups
+        }
+
+    async def find_all_by_channel(self, channel_id: str) -> list[DailyRollup]:
+        """
+        채널의 저장된 일간 집계 전체 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            list[DailyRollup]: 저장된 집계 목록
+        """
+        channel_rollups = (await self._load())["rollups"].get(channel_id, {})
+        return [DailyRollup.from_dict(rollup) for rollup in channel_rollups.values()]
+
+    async def save_all(self, rollups: list[DailyRollup]) -> None:
+        """
+        일간 집계 저장 (같은 채널/일자는 덮어씀)
+
+        Args:
+            rollups: 저장할 집계 목록
+        """
+        if not rollups:
+            return
+
+        async with self._lock:
+            data = await self._load()
+            for rollup in rollups:
+                data["rollups"].setdefault(rollup.channel_id, {})[rollup.date.isoformat()] = rollup.to_dict()
+            await self.file.save(data)
+
+    async def get_sync_token(self, channel_id: str) -> str | None:
+        """
+        집계 이후 변경분 확인에 사용할 채널 동기화 토큰 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            str | None: 저장된 동기화 토큰 (없으면 None)
+        """
+        return (await self._load())["tokens"].get(channel_id)
+
+    async def save_sync_token(self, channel_id: str, token: str) -> None:
+        """
+        채널 동기화 토큰 저장
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 동기화 토큰
+        """
+        async with self._lock:
+            data = await self._load()
+            if data["tokens"].get(channel_id) == token:
+                return
+
+            data["tokens"][channel_id] = token
+            await self.file.save(data)
+
+    async def _load(self) -> dict:
+        """
+        집계 파일을 처음 사용할 때 한 번만 읽음
+        """
+        if self._data is None:
+            self._data = {"rollups": {}, "tokens": {}} | await self.file.load()
+        return self._data
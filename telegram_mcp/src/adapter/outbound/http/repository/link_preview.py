@@ -0,0 +1,400 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager, suppress
+from html.parser import HTMLParser
+import ipaddress
+import socket
+
+import httpcore
+import httpx
+from src.adapter.outbound.file_storage.json_file import JsonFile
+from src.application.port.output.link_preview import LinkPreviewPort
+from src.domain.entities.link import LinkPreview, canonicalize_url
+
+# 가져올 수 있는 URL scheme
+ALLOWED_SCHEMES = {"http", "https"}
+# 실패 응답 중 캐시할 확정 상태 코드 (5xx, 429 등 일시적 실패는 캐시하지 않음)
+CACHEABLE_ERROR_STATUSES = {404, 410}
+
+
+class BlockedAddressError(httpcore.ConnectError):
+    """
+    공인 IP가 아닌 주소로의 연결을 차단할 때 발생하는 예외 (httpx에서는 ConnectError로 전달됨)
+    """
+
+
+async def _resolve(host: str) -> list[str]:
+    """
+    호스트의 IP 주소 목록 조회
+    """
+    infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    return [info[4][0] for info in infos]
+
+
+def _is_public(address: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
+    """
+    인터넷에서 라우팅되는 유니캐스트 주소 여부 (IPv4-mapped IPv6는 IPv4 주소로 판단)
+    """
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+class _PublicAddressBackend(httpcore.AsyncNetworkBackend):
+    """
+    연결 시점에 호스트를 조회해 공인 IP로만 연결하는 httpcore 네트워크 백엔드
+
+    리다이렉트를 포함한 모든 새 연결마다 사설/루프백/링크로컬/예약 주소가 하나라도 있으면 차단하고,
+    검사한 IP로 직접 연결해 검사 이후 DNS 응답이 바뀌어도 내부 주소로 연결되지 않게 한다.
+    요청 URL은 그대로 두므로 연결 풀, SNI, 인증서 검증은 호스트 이름 기준으로 동작한다.
+    """
+
+    def __init__(
+        self, resolve: Callable[[str], Awaitable[list[str]]], backend: httpcore.AsyncNetworkBackend | None = None
+    ):
+        """
+        _PublicAddressBackend 초기화
+
+        Args:
+            resolve: 호스트의 IP 주소 목록을 조회하는 함수
+            backend: 검사한 IP로 실제 연결할 네트워크 백엔드
+        """
+        self.resolve = resolve
+        self.backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """
+        호스트의 주소를 검사한 뒤 조회한 IP에 순서대로 연결
+
+        Raises:
+            BlockedAddressError: 공인 IP가 아닌 주소가 포함된 경우
+            httpcore.ConnectError: 호스트를 조회할 수 없거나 모든 IP에 연결하지 못한 경우
+        """
+        try:
+            addresses = [ipaddress.ip_address(address) for address in await self.resolve(host)]
+        except (OSError, ValueError) as e:
+            raise httpcore.ConnectError(f"호스트를 조회할 수 없습니다: {host}") from e
+
+        if not addresses or not all(_is_public(address) for address in addresses):
+            raise BlockedAddressError(f"공인 IP가 아닌 주소입니다: {host}")
+
+        error = None
+        for address in addresses:
+            try:
+                return await self.backend.connect_tcp(str(address), port, timeout, local_address, socket_options)
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """
+        유닉스 소켓 연결은 허용하지 않음
+        """
+        raise BlockedAddressError(f"유닉스 소켓에는 연결할 수 없습니다: {path}")
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        재시도 대기
+        """
+        await self.backend.sleep(seconds)
+
+
+class _PublicAddressTransport(httpx.AsyncHTTPTransport):
+    """
+    _PublicAddressBackend로 연결하는 httpx 전송 계층
+    """
+
+    def __init__(self, limits: httpx.Limits, backend: _PublicAddressBackend):
+        """
+        _PublicAddressTransport 초기화
+
+        AsyncHTTPTransport는 네트워크 백엔드를 받지 않으므로 같은 설정의 연결 풀을 백엔드를 지정해 다시 만든다.
+        """
+        super().__init__(limits=limits)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=backend,
+        )
+
+
+class _HeadMetaParser(HTMLParser):
+    """
+    HTML에서 <title>과 og:title/og:description/description 메타 태그 추출
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: dict[str, str] = {}
+        self.title: str | None = None
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """
+        제목 태그 시작과 meta 태그 처리
+        """
+        if tag == "title" and self.title is None:
+            self._in_title = True
+        elif tag == "meta":
+            attributes = dict(attrs)
+            key = (attributes.get("property") or attributes.get("name") or "").lower()
+            if key in {"og:title", "og:description", "description"} and attributes.get("content"):
+                self.meta.setdefault(key, attributes["content"].strip())
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        제목 태그 종료 처리
+        """
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        """
+        제목 태그 본문 수집
+        """
+        if self._in_title:
+            self.title = ((self.title or "") + data).strip()
+
+
+class HttpxLinkPreviewRepository(LinkPreviewPort):
+    """
+    httpx로 페이지 제목/설명을 가져와 링크 미리보기를 만드는 Repository
+
+    연결 풀을 공유하는 AsyncClient 하나로 요청하고 호스트별 동시 요청 수를 제한한다.
+    http(s) URL만 가져오며, 리다이렉트를 포함해 공인 IP가 아닌 주소로는 요청하지 않는다.
+    결과는 정규화 URL 기준으로 최대 cache_size개를 캐시하며 (일시적 실패 응답은 제외),
+    변경된 캐시는 flush_interval초마다 한 번, 그리고 aclose() 시 JSON 파일에 쓴다.
+    동시에 들어온 같은 URL 요청은 하나의 요청을 공유한다.
+    """
+
+    # 미리보기 추출을 위해 읽을 최대 응답 크기 (바이트)
+    MAX_BODY_BYTES = 256 * 1024
+
+    def __init__(
+        self,
+        cache_path: str,
+        cache_size: int = 50_000,
+        max_connections: int = 100,
+        per_host_limit: int = 4,
+        timeout: float = 10.0,
+        flush_interval: float = 30.0,
+        resolve: Callable[[str], Awaitable[list[str]]] = _resolve,
+        network_backend: httpcore.AsyncNetworkBackend | None = None,
+    ):
+        """
+        HttpxLinkPreviewRepository 초기화
+
+        Args:
+            cache_path: 캐시 JSON 파일 경로
+            cache_size: 캐시할 최대 URL 수
+            max_connections: 연결 풀 최대 연결 수
+            per_host_limit: 호스트별 최대 동시 요청 수
+            timeout: 요청 타임아웃 (초)
+            flush_interval: 변경된 캐시를 파일에 쓰는 주기 (초)
+            resolve: 호스트의 IP 주소 목록을 조회하는 함수 (테스트용 대체 DNS 지정)
+            network_backend: 주소 검사 후 실제 연결할 네트워크 백엔드 (테스트용 대체 서버 지정)
+        """
+        self.file = JsonFile(cache_path)
+        self.cache_size = cache_size
+        self.per_host_limit = per_host_limit
+        self.flush_interval = flush_interval
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client_options = {
+            "timeout": timeout,
+            "follow_redirects": True,
+            "headers": {"User-Agent": "telegram-mcp-link-preview/1.0"},
+            # 환경 변수 프록시를 쓰면 주소 검사 없이 프록시가 연결하므로 사용하지 않음
+            "trust_env": False,
+            "transport": _PublicAddressTransport(limits, _PublicAddressBackend(resolve, network_backend)),
+        }
+        self._client: httpx.AsyncClient | None = None
+        self._cache: OrderedDict[str, dict] | None = None
+        # 요청 중이거나 대기 중인 호스트별 (세마포어, 사용 중인 요청 수)
+        self._host_semaphores: dict[str, tuple[asyncio.Semaphore, int]] = {}
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._lock = asyncio.Lock()
+        self._dirty = False
+        self._flush_task: asyncio.Task | None = None
+
+    async def fetch_previews(self, urls: list[str]) -> dict[str, LinkPreview]:
+        """
+        URL별 링크 미리보기 조회 (캐시에 없는 URL만 요청)
+
+        Args:
+            urls: 조회할 URL 목록
+
+        Returns:
+            dict[str, LinkPreview]: 입력 URL별 미리보기 (가져오지 못한 URL은 제외)
+        """
+        cache = await self._load()
+        canonical_urls = {}
+        for url in dict.fromkeys(urls):
+            try:
+                canonical_url = canonicalize_url(url)
+                scheme = httpx.URL(canonical_url).scheme
+            except (ValueError, httpx.InvalidURL):
+                # 포트가 숫자가 아닌 등 해석할 수 없는 URL은 제외
+                continue
+            if scheme in ALLOWED_SCHEMES:
+                canonical_urls[url] = canonical_url
+
+        missing = {canonical for canonical in canonical_urls.values() if canonical not in cache}
+        for canonical in missing:
+            if canonical not in self._in_flight:
+                task = asyncio.create_task(self._fetch(canonical))
+                task.add_done_callback(lambda _, canonical=canonical: self._in_flight.pop(canonical, None))
+                self._in_flight[canonical] = task
+
+        fetched = await asyncio.gather(*(self._in_flight[canonical] for canonical in missing))
+        if any(preview is not None for preview in fetched):
+            self._schedule_flush()
+
+        previews = {}
+        for url, canonical in canonical_urls.items():
+            if canonical in cache:
+                cache.move_to_end(canonical)
+                previews[url] = LinkPreview(url=url, **cache[canonical])
+        return previews
+
+    async def aclose(self) -> None:
+        """
+        변경된 캐시를 파일에 쓰고 연결 풀 종료
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self._save()
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch(self, canonical_url: str) -> dict | None:
+        """
+        페이지를 가져와 미리보기를 캐시에 기록
+
+        네트워크 오류, 차단된 주소, 일시적 실패 응답(5xx, 429 등)은 캐시하지 않는다.
+        """
+        try:
+            host = httpx.URL(canonical_url).host
+            async with self._host_slot(host), self._get_client().stream("GET", canonical_url) as response:
+                if not response.is_success and response.status_code not in CACHEABLE_ERROR_STATUSES:
+                    return None
+                preview = {"canonical_url": canonical_url, "final_url": canonicalize_url(str(response.url))}
+                if response.is_success and "html" in response.headers.get("content-type", ""):
+                    preview |= self._parse(await self._read_head(response), response.encoding or "utf-8")
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+            return None
+
+        self._remember(canonical_url, preview)
+        if preview["final_url"] != canonical_url:
+            self._remember(preview["final_url"], preview | {"canonical_url": preview["final_url"]})
+        return preview
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        """
+        호스트별 동시 요청 수 제한 (사용 중인 요청이 없는 호스트의 세마포어는 제거)
+        """
+        semaphore, users = self._host_semaphores.get(host, (asyncio.Semaphore(self.per_host_limit), 0))
+        self._host_semaphores[host] = (semaphore, users + 1)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, users = self._host_semaphores[host]
+            if users == 1:
+                del self._host_semaphores[host]
+            else:
+                self._host_semaphores[host] = (semaphore, users - 1)
+
+    async def _read_head(self, response: httpx.Response) -> bytes:
+        """
+        응답 본문을 MAX_BODY_BYTES까지만 읽음
+        """
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body.extend(chunk)
+            if len(body) >= self.MAX_BODY_BYTES:
+                break
+        return bytes(body[: self.MAX_BODY_BYTES])
+
+    @staticmethod
+    def _parse(body: bytes, encoding: str) -> dict:
+        """
+        HTML에서 제목/설명 추출 (og 태그 우선)
+        """
+        parser = _HeadMetaParser()
+        parser.feed(body.decode(encoding, errors="replace"))
+        return {
+            "title": parser.meta.get("og:title") or parser.title or None,
+            "description": parser.meta.get("og:description") or parser.meta.get("description"),
+        }
+
+    def _remember(self, canonical_url: str, preview: dict) -> None:
+        """
+        캐시에 기록 (최대 cache_size개, 오래 사용되지 않은 항목부터 제거)
+        """
+        self._cache[canonical_url] = preview
+        self._cache.move_to_end(canonical_url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        연결 풀을 공유하는 AsyncClient를 처음 사용할 때 생성
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_options)
+        return self._client
+
+    async def _load(self) -> OrderedDict[str, dict]:
+        """
+        캐시 파일을 처음 사용할 때 한 번만 읽음
+        """
+        async with self._lock:
+            if self._cache is None:
+                self._cache = OrderedDict(await self.file.load())
+        return self._cache
+
+    def _schedule_flush(self) -> None:
+        """
+        캐시를 변경됨으로 표시하고, 예약된 쓰기가 없으면 flush_interval초 뒤 쓰기를 예약
+        """
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """
+        flush_interval초 뒤 캐시 파일 쓰기
+        """
+        await asyncio.sleep(self.flush_interval)
+        await self._save()
+
+    async def _save(self) -> None:
+        """
+        변경된 캐시가 있으면 캐시 파일 쓰기
+        """
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            await self.file.save(dict(self._cache))
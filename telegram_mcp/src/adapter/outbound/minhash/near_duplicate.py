@@ -0,0 +1,307 @@
+from dataclasses import replace
+import re
+import threading
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.application.port.output.near_duplicate import NearDuplicatePort
+from src.domain.entities.message import Message
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class MinHashNearDuplicateIndex(NearDuplicatePort):
+    """
+    MinHash 서명과 LSH 밴드 인덱스로 채널 간 유사 중복 메시지를 묶는 인메모리 인덱스
+
+    최근 capacity개 메시지의 서명만 링 버퍼에 유지하므로 메모리 사용량은 유입량과 무관하게 고정된다.
+    밴드 키 정렬 인덱스는 배치마다 밀려난 슬롯을 빼고 새 키만 병합해 갱신한다.
+    클러스터마다 처음 인덱스에 추가된 메시지(같은 배치에서는 가장 오래된 메시지)를 대표로 기록한다.
+    공개 메서드는 잠금으로 보호되므로 여러 스레드에서 호출할 수 있다.
+    """
+
+    # 한 번에 MinHash를 계산할 최대 shingle 수 (shingle x num_perm 중간 행렬 크기 제한)
+    CHUNK_SHINGLES = 50_000
+    SHINGLE_BASE = 1_000_003
+    BAND_SALT = 0x9E3779B97F4A7C15
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.7,
+        shingle_size: int = 5,
+        min_length: int = 20,
+        seed: int = 0,
+    ):
+        """
+        MinHashNearDuplicateIndex 초기화
+
+        Args:
+            capacity: 인덱스에 유지할 최근 메시지 수
+            num_perm: MinHash 서명 길이
+            bands: LSH 밴드 수 (num_perm의 약수, 기본값 16x4행은 Jaccard 0.7에서 약 99%를 후보로 찾음)
+            threshold: 같은 클러스터로 묶을 추정 Jaccard 유사도
+            shingle_size: 문자 shingle 길이
+            min_length: 클러스터를 부여할 최소 본문 길이 (정규화 후)
+            seed: 해시 함수 시드
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다.")
+
+        self.capacity = capacity
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_length = max(min_length, shingle_size)
+
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._perm_b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_mix = rng.integers(1, 2**63, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+        self._band_salt = np.arange(bands, dtype=np.uint64) * np.uint64(self.BAND_SALT)
+        self._shingle_powers = np.array(
+            [pow(self.SHINGLE_BASE, shingle_size - 1 - i, 2**64) for i in range(shingle_size)], dtype=np.uint64
+        )
+
+        # 링 버퍼: slot < _size 인 슬롯만 유효
+        self._signatures = np.zeros((capacity, num_perm), dtype=np.uint32)
+        self._band_keys = np.zeros((capacity, bands), dtype=np.uint64)
+        self._clusters = np.zeros(capacity, dtype=np.int64)
+        self._peer_ids = np.zeros(capacity, dtype=np.int64)
+        self._message_ids = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+        self._next_slot = 0
+        self._next_cluster = 1
+
+        # 밴드 키 정렬 인덱스 (배치마다 증분 갱신)
+        self._sorted_keys = np.empty(0, dtype=np.uint64)
+        self._sorted_slots = np.empty(0, dtype=np.int64)
+
+        # 인덱스에 남아 있는 메시지의 클러스터 ID ((peer_id, message_id) 기준)
+        self._seen: dict[tuple[int, int], int] = {}
+        # 인덱스에 멤버가 남아 있는 클러스터의 대표 메시지와 멤버 수
+        self._representatives: dict[int, tuple[int, int]] = {}
+        self._cluster_sizes: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def assign_clusters(self, messages: list[Message]) -> list[Message]:
+        """
+        메시지를 인덱스에 추가하고 유사 중복 클러스터 ID를 부여
+
+        Args:
+            messages: 클러스터를 부여할 메시지 목록
+
+        Returns:
+            list[Message]: cluster_id가 채워진 메시지 목록 (본문이 너무 짧으면 None)
+        """
+        with self._lock:
+            return self._assign_clusters(messages)
+
+    def _assign_clusters(self, messages: list[Message]) -> list[Message]:
+        """
+        assign_clusters() 구현 (잠금을 잡은 상태에서 호출)
+        """
+        clusters: dict[tuple[int, int], int] = {}
+        pending: dict[tuple[int, int], str] = {}
+
+        # 시간순으로 추가해야 새 클러스터의 대표가 배치에서 가장 오래된 메시지가 됨
+        for message in sorted(messages, key=lambda message: message.ts):
+            key = (message.peer_id, message.id)
+            if key in self._seen:
+                clusters[key] = self._seen[key]
+                continue
+            text = WHITESPACE_PATTERN.sub(" ", (message.message or "").lower()).strip()
+            if len(text) >= self.min_length:
+                pending[key] = text
+
+        if pending:
+            clusters |= self._cluster(list(pending), list(pending.values()))
+
+        return [replace(message, cluster_id=clusters.get((message.peer_id, message.id))) for message in messages]
+
+    def find_representatives(self, cluster_ids: set[int]) -> dict[int, tuple[int, int]]:
+        """
+        클러스터별 대표 메시지 조회
+
+        Args:
+            cluster_ids: 조회할 클러스터 ID 목록
+
+        Returns:
+            dict[int, tuple[int, int]]: 클러스터 ID별 대표 메시지 (peer_id, message_id) (인덱스에서 밀려난 클러스터는 제외)
+        """
+        with self._lock:
+            return {
+                cluster_id: self._representatives[cluster_id]
+                for cluster_id in cluster_ids
+                if cluster_id in self._representatives
+            }
+
+    def _cluster(self, keys: list[tuple[int, int]], texts: list[str]) -> dict[tuple[int, int], int]:
+        """
+        새 메시지들의 클러스터를 결정하고 인덱스에 추가
+        """
+        signatures = self._signatures_of(texts)
+        band_keys = self._band_keys_of(signatures)
+        starts, ends = self._lookup(band_keys)
+
+        assigned = np.zeros(len(texts), dtype=np.int64)
+        batch_buckets: dict[int, list[int]] = {}
+
+        for row, row_keys in enumerate(band_keys.tolist()):
+            slots = self._candidates(self._sorted_slots, starts[row], ends[row])
+            rows = np.unique(
+                np.array([other for key in row_keys for other in batch_buckets.get(key, ())], dtype=np.int64)
+            )
+            cluster = self._best_match(
+                signatures[row],
+                np.concatenate([self._signatures[slots], signatures[rows]]),
+                np.concatenate([self._clusters[slots], assigned[rows]]),
+            )
+
+            if not cluster:
+                cluster = self._next_cluster
+                self._next_cluster += 1
+            assigned[row] = cluster
+
+            for key in row_keys:
+                batch_buckets.setdefault(key, []).append(row)
+
+        self._insert(keys, signatures, band_keys, assigned)
+        return {key: int(cluster) for key, cluster in zip(keys, assigned, strict=True)}
+
+    @staticmethod
+    def _candidates(sorted_slots: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        밴드별 [start, end) 구간의 인덱스 슬롯을 중복 없이 모음
+        """
+        ranges = [
+            sorted_slots[start:end] for start, end in zip(starts.tolist(), ends.tolist(), strict=True) if end > start
+        ]
+        if not ranges:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(ranges))
+
+    def _best_match(self, signature: np.ndarray, candidates: np.ndarray, clusters: np.ndarray) -> int:
+        """
+        후보 중 추정 Jaccard 유사도가 가장 높고 threshold 이상인 후보의 클러스터 ID (없으면 0)
+        """
+        if not len(candidates):
+            return 0
+
+        similarities = np.count_nonzero(candidates == signature, axis=1) / self.num_perm
+        best = int(np.argmax(similarities))
+        return int(clusters[best]) if similarities[best] >= self.threshold else 0
+
+    def _signatures_of(self, texts: list[str]) -> np.ndarray:
+        """
+        텍스트 목록의 MinHash 서명 계산 (shingle 수 기준으로 나눠서 계산)
+        """
+        signatures = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        start = 0
+        shingles = 0
+
+        for end, text in enumerate(texts, start=1):
+            shingles += len(text) - self.shingle_size + 1
+            if shingles >= self.CHUNK_SHINGLES or end == len(texts):
+                signatures[start:end] = self._minhash(texts[start:end])
+                start = end
+                shingles = 0
+        return signatures
+
+    def _minhash(self, texts: list[str]) -> np.ndarray:
+        """
+        텍스트 묶음의 MinHash 서명을 한 번의 벡터 연산으로 계산
+
+        모든 텍스트의 코드포인트를 이어 붙여 문자 shingle을 다항식 해시로 만들고,
+        텍스트 경계를 넘는 shingle은 제외한 뒤 텍스트별 최솟값을 구한다.
+        """
+        lengths = np.array([len(text) for text in texts], dtype=np.int64)
+        codepoints = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        window_hashes = sliding_window_view(codepoints, self.shingle_size) @ self._shingle_powers
+
+        counts = lengths - self.shingle_size + 1
+        text_offsets = np.cumsum(lengths) - lengths
+        shingle_offsets = np.cumsum(counts) - counts
+        shingle_index = np.arange(counts.sum()) + np.repeat(text_offsets - shingle_offsets, counts)
+        shingle_hashes = window_hashes[shingle_index]
+
+        # (num_perm, shingle) 배치로 두어야 텍스트별 reduceat이 연속 메모리를 따라 진행된다
+        hashed = ((self._perm_a[:, None] * shingle_hashes + self._perm_b[:, None]) >> np.uint64(32)).astype(np.uint32)
+        return np.minimum.reduceat(hashed, shingle_offsets, axis=1).T
+
+    def _band_keys_of(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        서명을 밴드로 나눠 밴드별 해시 키 계산 (밴드 번호로 salt 처리해 하나의 키 공간 사용)
+        """
+        rows = signatures.astype(np.uint64).reshape(len(signatures), self.bands, -1)
+        return (rows * self._band_mix).sum(axis=2, dtype=np.uint64) ^ self._band_salt
+
+    def _lookup(self, band_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        밴드 키별로 같은 키를 가진 정렬 인덱스 구간 [start, end) 조회 (없으면 빈 구간)
+        """
+        flat = band_keys.ravel()
+        starts = np.searchsorted(self._sorted_keys, flat, side="left")
+        ends = np.searchsorted(self._sorted_keys, flat, side="right")
+        return starts.reshape(band_keys.shape), ends.reshape(band_keys.shape)
+
+    def _insert(
+        self, keys: list[tuple[int, int]], signatures: np.ndarray, band_keys: np.ndarray, clusters: np.ndarray
+    ) -> None:
+        """
+        링 버퍼에 추가하고 밀려난 메시지를 제거한 뒤 정렬 인덱스 갱신
+        """
+        if len(keys) > self.capacity:
+            keys, signatures = keys[-self.capacity :], signatures[-self.capacity :]
+            band_keys, clusters = band_keys[-self.capacity :], clusters[-self.capacity :]
+
+        slots = (self._next_slot + np.arange(len(keys))) % self.capacity
+        evicted = slots[slots < self._size]
+        for slot in evicted:
+            self._seen.pop((int(self._peer_ids[slot]), int(self._message_ids[slot])), None)
+            self._release(int(self._clusters[slot]))
+
+        self._signatures[slots] = signatures
+        self._band_keys[slots] = band_keys
+        self._clusters[slots] = clusters
+        self._peer_ids[slots] = [peer_id for peer_id, _ in keys]
+        self._message_ids[slots] = [message_id for _, message_id in keys]
+        for key, cluster in zip(keys, clusters.tolist(), strict=True):
+            self._seen[key] = cluster
+            self._representatives.setdefault(cluster, key)
+            self._cluster_sizes[cluster] = self._cluster_sizes.get(cluster, 0) + 1
+
+        self._next_slot = int(slots[-1] + 1) % self.capacity
+        self._size = min(self._size + len(keys), self.capacity)
+        self._reindex(evicted, slots, band_keys)
+
+    def _reindex(self, evicted: np.ndarray, slots: np.ndarray, band_keys: np.ndarray) -> None:
+        """
+        정렬 인덱스에서 밀려난 슬롯의 키를 제거하고 새 슬롯의 키를 병합 (전체 재정렬 없이 O(n + k log k))
+        """
+        if len(evicted):
+            removed = np.zeros(self.capacity, dtype=bool)
+            removed[evicted] = True
+            keep = ~removed[self._sorted_slots]
+            self._sorted_keys = self._sorted_keys[keep]
+            self._sorted_slots = self._sorted_slots[keep]
+
+        new_keys = band_keys.ravel()
+        order = np.argsort(new_keys, kind="stable")
+        new_keys = new_keys[order]
+        new_slots = np.repeat(slots, self.bands)[order]
+        positions = np.searchsorted(self._sorted_keys, new_keys, side="right")
+        self._sorted_keys = np.insert(self._sorted_keys, positions, new_keys)
+        self._sorted_slots = np.insert(self._sorted_slots, positions, new_slots)
+
+    def _release(self, cluster: int) -> None:
+        """
+        인덱스에서 밀려난 멤버를 클러스터에서 제거하고, 멤버가 없으면 대표도 제거
+        """
+        self._cluster_sizes[cluster] -= 1
+        if not self._cluster_sizes[cluster]:
+            del self._cluster_sizes[cluster]
+            del self._representatives[cluster]
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-from telethon.tl.types import Message, PeerChannel, PeerChat, PeerUser, TypePeer
+from src.domain.entities.link import extract_urls
+from src.domain.entities.message import MessageField
+from telethon.tl.types import Message, MessageEntityTextUrl, MessageEntityUrl, PeerChannel, PeerChat, PeerUser, TypePeer
+from telethon.utils import get_peer_id
 
 
 @dataclass
@@ -15,14 +19,31 @@ class TelegramMessageEntity:
     peer_name: str
     peer_id: int
     _ts: datetime
+    _edit_ts: datetime | None = None
+    fields: frozenset[MessageField] = frozenset()
+    sender_id: int | None = None
+    sender_username: str | None = None
+    sender_first_name: str | None = None
+    forward_from_channel: str | None = None
+    _forward_ts: datetime | None = None
+    reply_to_message_id: int | None = None
+    media_type: str | None = None
+    urls: tuple[str, ...] = ()
 
     @classmethod
-    def from_telethon(cls, data: Message) -> "TelegramMessageEntity":
+    def from_telethon(
+        cls,
+        data: Message,
+        fields: frozenset[MessageField] = frozenset(),
+        entities: dict[int, Any] | None = None,
+    ) -> "TelegramMessageEntity":
         """
         Telegram API 응답을 도메인 모델로 변환하는 Entity
 
         Args:
             data: Telegram API 응답
+            fields: 기본 필드 외에 계산할 필드 그룹
+            entities: 응답에 포함되지 않은 발신자/원본 채널을 미리 조회해 둔 엔티티 (peer ID 기준)
 
         Returns:
             TelegramMessageEntity: 도메인 모델
@@ -38,10 +59,64 @@ class TelegramMessageEntity:
             if isinstance(peer, PeerChannel):
                 return peer_info["channel_id"]
 
-        return cls(
+        entity = cls(
             id=data.id,
             message=data.message,
             _ts=data.date,
+            _edit_ts=data.edit_date,
             peer_name=data.peer_id.to_dict()["_"],
             peer_id=_get_peer_id(data.peer_id),
+            fields=fields,
         )
+        entities = entities or {}
+
+        if MessageField.SENDER in fields:
+            sender = data.sender or entities.get(data.sender_id)
+            entity.sender_id = data.sender_id
+            entity.sender_username = getattr(sender, "username", None)
+            entity.sender_first_name = getattr(sender, "first_name", None)
+
+        if MessageField.FORWARD in fields and data.fwd_from is not None:
+            entity._forward_ts = data.fwd_from.date
+            if isinstance(data.fwd_from.from_id, PeerChannel):
+                chat = (data.forward and data.forward.chat) or entities.get(get_peer_id(data.fwd_from.from_id))
+                entity.forward_from_channel = getattr(chat, "username", None) or getattr(chat, "title", None)
+
+        if MessageField.REPLY in fields and data.reply_to is not None:
+            entity.reply_to_message_id = data.reply_to.reply_to_msg_id
+
+        if MessageField.MEDIA in fields:
+            entity.media_type = cls._get_media_type(data)
+
+        if MessageField.LINKS in fields:
+            entity.urls = cls._get_urls(data)
+
+        return entity
+
+    @staticmethod
+    def _get_urls(data: Message) -> tuple[str, ...]:
+        """
+        본문과 메시지 엔티티(텍스트 링크, scheme 없는 URL)에서 URL 추출
+        """
+        urls = extract_urls(data.message)
+        for entity, text in data.get_entities_text((MessageEntityUrl, MessageEntityTextUrl)):
+            if isinstance(entity, MessageEntityTextUrl):
+                urls.append(entity.url)
+            elif "://" not in text:
+                urls.append(f"http://{text}")
+        return tuple(dict.fromkeys(urls))
+
+    @staticmethod
+    def _get_media_type(data: Message) -> str | None:
+        """
+        메시지 미디어 종류 ('photo', 'video', 'audio', 'document')
+        """
+        if data.photo:
+            return "photo"
+        if data.video:
+            return "video"
+        if data.audio or data.voice:
+            return "audio"
+        if data.document:
+            return "document"
+        return None
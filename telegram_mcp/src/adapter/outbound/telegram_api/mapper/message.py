@@ -21,4 +21,14 @@ class TelegramMessageMapper:
             peer_name=entity.peer_name,
             peer_id=entity.peer_id,
             _ts=entity._ts,
+            _edit_ts=entity._edit_ts,
+            fields=entity.fields,
+            sender_id=entity.sender_id,
+            sender_username=entity.sender_username,
+            sender_first_name=entity.sender_first_name,
+            forward_from_channel=entity.forward_from_channel,
+            _forward_ts=entity._forward_ts,
+            reply_to_message_id=entity.reply_to_message_id,
+            media_type=entity.media_type,
+            urls=entity.urls,
         )
@@ -1,11 +1,43 @@
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Any
 
 from src.adapter.outbound.telegram_api.entity.message import TelegramMessageEntity
 from src.adapter.outbound.telegram_api.mapper.message import TelegramMessageMapper
 from src.application.port.output.message import MessagePort
-from src.domain.entities.message import Message
-from src.infrastructure.exception import MessageNotFoundError
+from src.application.port.output.message_index import MessageIndexPort
+from src.domain.entities.message import Message, MessageField
+from src.domain.entities.sync import MessageChanges, SyncToken
+from src.infrastructure.exception import InvalidSyncTokenError, MessageNotFoundError, SyncTokenExpiredError
 from src.infrastructure.telegram_client import TelegramClient
+from telethon import utils
+from telethon.errors import RPCError
+from telethon.tl.functions.channels import GetChannelsRequest, GetFullChannelRequest
+from telethon.tl.functions.updates import GetChannelDifferenceRequest
+from telethon.tl.functions.users import GetUsersRequest
+from telethon.tl.types import (
+    ChannelMessagesFilterEmpty,
+    InputChannel,
+    InputPeerChannel,
+    InputUser,
+    Message as TelethonMessage,
+    PeerChannel,
+    PeerUser,
+    TypePeer,
+    UpdateDeleteChannelMessages,
+    UpdateEditChannelMessage,
+    UserEmpty,
+)
+from telethon.tl.types.updates import ChannelDifferenceEmpty, ChannelDifferenceTooLong
+from telethon.utils import get_peer_id
+
+
+def _is_hour(ts: datetime) -> bool:
+    """
+    정시(시간 경계) 여부
+    """
+    return ts.minute == 0 and ts.second == 0 and ts.microsecond == 0
 
 
 class TelegramMessageRepository(MessagePort):
@@ -13,18 +45,33 @@ class TelegramMessageRepository(MessagePort):
     Telegram API를 통해 메시지를 조회하는 Repository
     """
 
-    def __init__(self, telegram_client: TelegramClient):
+    # 한 번의 변경분 조회에서 가져올 최대 업데이트 수
+    SYNC_DIFFERENCE_LIMIT = 1000
+    # 발신자/원본 채널 엔티티 캐시 최대 크기
+    ENTITY_CACHE_SIZE = 10_000
+    # 엔티티 조회에 실패한 peer를 다시 조회하지 않을 시간 (초)
+    ENTITY_FAILURE_TTL = 60
+    # 경계 인덱스에 기록할 경계의 최소 경과 시간 (늦게 보이는 메시지와 Telegram 서버와의 시계 차이 대비)
+    INDEX_SAFETY_MARGIN = timedelta(minutes=5)
+
+    def __init__(self, telegram_client: TelegramClient, message_index: MessageIndexPort | None = None):
         """
         TelegramMessageRepository 초기화
         """
         self.telegram_client = telegram_client
+        self.message_index = message_index
+        # 발신자/원본 채널 엔티티 캐시 (peer ID 기준)
+        self._entity_cache: OrderedDict[int, Any] = OrderedDict()
+        # 엔티티 조회에 실패한 peer ID별 재조회 대기 만료 시각 (time.monotonic 기준)
+        self._entity_failures: dict[int, float] = {}
 
-    async def find_latest_by_channel(self, channel_id: str) -> Message:
+    async def find_latest_by_channel(self, channel_id: str, fields: frozenset[MessageField] = frozenset()) -> Message:
         """
         채널의 가장 최근 메시지 1개 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             Message: 채널의 가장 최근 메시지
@@ -38,26 +85,338 @@ class TelegramMessageRepository(MessagePort):
             if not message:
                 raise MessageNotFoundError(f"채널 {channel_id}의 메시지가 없습니다.")
 
-            return TelegramMessageMapper.to_domain(TelegramMessageEntity.from_telethon(message[0]))
+            return (await self._to_domain(self.telegram_client, message[:1], fields))[0]
 
     async def find_by_channel_and_date_range(
-        self, channel_id: str, start_ts: datetime, end_ts: datetime
+        self,
+        channel_id: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        fields: frozenset[MessageField] = frozenset(),
     ) -> list[Message]:
         """
+        특정 날짜 범위의 채널 메시지 조회
+
+        경계 인덱스에 시작/종료 시각이 기록되어 있으면 min_id/max_id로 범위를 바로 지정해 조회하고,
+        조회하면서 지나친 시간 경계 중 조회 시작 시각보다 INDEX_SAFETY_MARGIN 이상 지난 경계는 인덱스에 기록한다.
 
         Args:
             channel_id (str): 채널 username (@python) 또는 ID
             start_ts (datetime): 시작 타임스탬프
             end_ts (datetime): 종료 타임스탬프
+            fields (frozenset[MessageField]): 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             list[Message]: 해당 날짜 범위의 메시지 목록
         """
-        messages = []
+        visited = []
 
         async with self.telegram_client as c:
-            async for message in c.client.iter_messages(channel_id, offset_date=end_ts):
+            peer_id = await self._index_peer_id(c, channel_id)
+            bounds = await self._get_boundaries(peer_id, [start_ts, end_ts])
+            request = {"max_id": bounds[end_ts] + 1} if end_ts in bounds else {"offset_date": end_ts}
+            if start_ts in bounds:
+                request["min_id"] = bounds[start_ts]
+
+            # 조회 중 정시가 지나도 조회 시작 이후의 경계는 기록하지 않도록 시작 전에 시각을 잡음
+            walk_started = datetime.now(timezone.utc)
+            async for message in c.client.iter_messages(channel_id, **request):
+                visited.append(message)
                 if message.date < start_ts:
                     break
-                messages.append(TelegramMessageMapper.to_domain(TelegramMessageEntity.from_telethon(message)))
-        return messages
+            messages = [message for message in visited if start_ts <= message.date < end_ts]
+            result = await self._to_domain(c, messages, fields)
+
+        await self._record_boundaries(
+            peer_id,
+            self._boundaries_from_walk(
+                visited, start_ts, min(end_ts, walk_started - self.INDEX_SAFETY_MARGIN), bounds.get(start_ts, 0)
+            ),
+        )
+        return result
+
+    async def estimate_count_by_channel_and_date_range(
+        self, channel_id: str, start_ts: datetime, end_ts: datetime
+    ) -> int:
+        """
+        특정 날짜 범위의 채널 메시지 수 추정
+
+        경계 인덱스를 사용하고, 기록되지 않은 경계는 offset_date 조회 1번으로 찾아
+        INDEX_SAFETY_MARGIN 이상 지난 정시 경계만 인덱스에 기록한다.
+        메시지 ID 차이로 계산하므로 삭제된 메시지만큼 실제보다 클 수 있다.
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            start_ts: 시작 타임스탬프
+            end_ts: 종료 타임스탬프
+
+        Returns:
+            int: 범위 내 메시지 수 (상한)
+        """
+        probed = {}
+
+        async with self.telegram_client as c:
+            peer_id = await self._index_peer_id(c, channel_id)
+            bounds = await self._get_boundaries(peer_id, [start_ts, end_ts])
+            now = datetime.now(timezone.utc)
+            for boundary in (start_ts, end_ts):
+                if boundary in bounds:
+                    continue
+                if boundary > now:
+                    # 아직 지나지 않은 경계는 최신 메시지 기준으로 계산하고 기록하지 않음
+                    latest = await c.client.get_messages(channel_id, limit=1)
+                    bounds[boundary] = latest[0].id if latest else 0
+                else:
+                    before = await c.client.get_messages(channel_id, limit=1, offset_date=boundary)
+                    bounds[boundary] = probed[boundary] = before[0].id if before else 0
+
+        settled = now - self.INDEX_SAFETY_MARGIN
+        await self._record_boundaries(
+            peer_id,
+            {
+                boundary: message_id
+                for boundary, message_id in probed.items()
+                if _is_hour(boundary) and boundary <= settled
+            },
+        )
+        return max(bounds[end_ts] - bounds[start_ts], 0)
+
+    async def _index_peer_id(self, telegram_client: TelegramClient, channel_id: str) -> int | None:
+        """
+        경계 인덱스 키로 사용할 채널 peer ID 조회 (username과 ID 표기가 같은 인덱스를 쓰도록, 인덱스가 없으면 None)
+        """
+        if self.message_index is None:
+            return None
+        return await telegram_client.client.get_peer_id(channel_id)
+
+    async def _get_boundaries(self, peer_id: int | None, boundaries: list[datetime]) -> dict[datetime, int]:
+        """
+        경계 인덱스 조회 (인덱스가 없으면 빈 딕셔너리)
+        """
+        if peer_id is None:
+            return {}
+        return await self.message_index.get_boundaries(peer_id, boundaries)
+
+    async def _record_boundaries(self, peer_id: int | None, boundaries: dict[datetime, int]) -> None:
+        """
+        경계 인덱스 기록 (인덱스가 없으면 무시)
+        """
+        if peer_id is None or not boundaries:
+            return
+        await self.message_index.record_boundaries(peer_id, boundaries)
+
+    @staticmethod
+    def _boundaries_from_walk(
+        visited: list[TelethonMessage], start_ts: datetime, end_ts: datetime, floor_id: int
+    ) -> dict[datetime, int]:
+        """
+        최신순으로 조회한 메시지 목록에서 [start_ts, end_ts] 사이의 정시 경계별 메시지 ID 계산
+
+        visited는 end_ts 이전 메시지를 start_ts 이전까지(또는 floor_id/채널 처음까지) 빠짐없이 담고 있어야 하며,
+        end_ts는 이후 더 이상 메시지가 추가되지 않을 만큼 지난 시각이어야 한다.
+
+        Args:
+            visited: 최신순 메시지 목록
+            start_ts: 시작 타임스탬프
+            end_ts: 종료 타임스탬프
+            floor_id: visited보다 오래된 메시지 중 가장 최근 메시지 ID (채널 처음이면 0)
+
+        Returns:
+            dict[datetime, int]: 경계 시각별 해당 시각 이전 마지막 메시지 ID
+        """
+        boundaries = {}
+        boundary = end_ts.replace(minute=0, second=0, microsecond=0)
+        i = 0
+
+        while boundary >= start_ts:
+            while i < len(visited) and visited[i].date >= boundary:
+                i += 1
+            boundaries[boundary] = visited[i].id if i < len(visited) else floor_id
+            boundary -= timedelta(hours=1)
+        return boundaries
+
+    async def _to_domain(
+        self, telegram_client: TelegramClient, messages: list[TelethonMessage], fields: frozenset[MessageField]
+    ) -> list[Message]:
+        """
+        Telethon 메시지 목록을 도메인 모델로 변환
+
+        발신자/전달 필드가 요청된 경우에만 응답에 포함되지 않은 엔티티를 한 번에 조회한다.
+        """
+        entities = {}
+        if fields & {MessageField.SENDER, MessageField.FORWARD}:
+            entities = await self._resolve_entities(telegram_client, messages, fields)
+
+        return [
+            TelegramMessageMapper.to_domain(TelegramMessageEntity.from_telethon(message, fields, entities))
+            for message in messages
+        ]
+
+    async def _resolve_entities(
+        self, telegram_client: TelegramClient, messages: list[TelethonMessage], fields: frozenset[MessageField]
+    ) -> dict[int, Any]:
+        """
+        메시지들의 발신자/원본 채널 엔티티를 캐시를 거쳐 일괄 조회
+
+        Returns:
+            dict[int, Any]: peer ID별 엔티티
+        """
+        peers: dict[int, TypePeer] = {}
+        for message in messages:
+            if MessageField.SENDER in fields and message.from_id is not None:
+                if message.sender is None:
+                    peers[get_peer_id(message.from_id)] = message.from_id
+                else:
+                    self._cache_entity(get_peer_id(message.from_id), message.sender)
+
+            forward = message.fwd_from
+            if MessageField.FORWARD in fields and forward is not None and isinstance(forward.from_id, PeerChannel):
+                if message.forward is None or message.forward.chat is None:
+                    peers[get_peer_id(forward.from_id)] = forward.from_id
+                else:
+                    self._cache_entity(get_peer_id(forward.from_id), message.forward.chat)
+
+        now = time.monotonic()
+        self._entity_failures = {peer_id: until for peer_id, until in self._entity_failures.items() if until > now}
+        missing = {
+            peer_id: peer
+            for peer_id, peer in peers.items()
+            if peer_id not in self._entity_cache and peer_id not in self._entity_failures
+        }
+        if missing:
+            await self._fetch_entities(telegram_client, missing, now)
+
+        entities = {}
+        for peer_id in peers:
+            if peer_id in self._entity_cache:
+                self._entity_cache.move_to_end(peer_id)
+                entities[peer_id] = self._entity_cache[peer_id]
+        return entities
+
+    async def _fetch_entities(self, telegram_client: TelegramClient, peers: dict[int, TypePeer], now: float) -> None:
+        """
+        엔티티를 사용자/채널별 요청 1번씩으로 일괄 조회해 캐시에 저장
+
+        세션에 저장된 peer는 저장된 access_hash로, 그 외 peer는 access_hash 0으로 한 요청에 담는다.
+        응답에 없는 peer(요청 자체가 실패하면 요청의 모든 peer)는 ENTITY_FAILURE_TTL 동안 다시 조회하지 않는다.
+        """
+        client = telegram_client.client
+        users, channels = [], []
+        for peer in peers.values():
+            try:
+                input_peer = await utils.maybe_async(client.session.get_input_entity(peer))
+            except ValueError:
+                input_peer = None
+            if isinstance(peer, PeerUser):
+                users.append(utils.get_input_user(input_peer) if input_peer else InputUser(peer.user_id, 0))
+            elif isinstance(peer, PeerChannel):
+                channels.append(utils.get_input_channel(input_peer) if input_peer else InputChannel(peer.channel_id, 0))
+
+        if users:
+            try:
+                for user in await client(GetUsersRequest(users)):
+                    if not isinstance(user, UserEmpty):
+                        self._cache_entity(get_peer_id(user), user)
+            except (RPCError, ValueError):
+                pass
+        if channels:
+            try:
+                for chat in (await client(GetChannelsRequest(channels))).chats:
+                    self._cache_entity(get_peer_id(chat), chat)
+            except (RPCError, ValueError):
+                pass
+
+        for peer_id in peers:
+            if peer_id not in self._entity_cache:
+                self._entity_failures[peer_id] = now + self.ENTITY_FAILURE_TTL
+
+    def _cache_entity(self, peer_id: int, entity: Any) -> None:
+        """
+        엔티티 캐시에 저장 (최대 ENTITY_CACHE_SIZE개, 오래 사용되지 않은 항목부터 제거)
+        """
+        self._entity_cache[peer_id] = entity
+        self._entity_cache.move_to_end(peer_id)
+        while len(self._entity_cache) > self.ENTITY_CACHE_SIZE:
+            self._entity_cache.popitem(last=False)
+
+    async def get_sync_token(self, channel_id: str) -> SyncToken:
+        """
+        채널의 현재 시점 동기화 토큰 발급
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            SyncToken: 채널의 현재 pts를 담은 동기화 토큰
+        """
+        async with self.telegram_client as c:
+            full = await c.client(GetFullChannelRequest(channel_id))
+            return SyncToken(channel_id=full.full_chat.id, pts=full.full_chat.pts)
+
+    async def find_changes_since(self, channel_id: str, token: SyncToken) -> MessageChanges:
+        """
+        동기화 토큰 이후 추가/수정/삭제된 채널 메시지 조회
+
+        Telegram의 채널 업데이트 스트림(getChannelDifference)을 사용하므로
+        조회 비용은 조회 기간이 아니라 변경량에 비례한다.
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 마지막 동기화 토큰
+
+        Returns:
+            MessageChanges: 토큰 이후의 변경분과 새 토큰
+
+        Raises:
+            InvalidSyncTokenError: 다른 채널의 토큰일 경우
+            SyncTokenExpiredError: 토큰이 너무 오래되었을 경우
+        """
+        async with self.telegram_client as c:
+            channel = await c.client.get_input_entity(channel_id)
+            if not isinstance(channel, InputPeerChannel) or channel.channel_id != token.channel_id:
+                raise InvalidSyncTokenError(f"채널 {channel_id}의 동기화 토큰이 아닙니다.")
+
+            difference = await c.client(
+                GetChannelDifferenceRequest(
+                    channel=channel,
+                    filter=ChannelMessagesFilterEmpty(),
+                    pts=token.pts,
+                    limit=self.SYNC_DIFFERENCE_LIMIT,
+                    force=True,
+                )
+            )
+
+        if isinstance(difference, ChannelDifferenceTooLong):
+            raise SyncTokenExpiredError(
+                f"채널 {channel_id}의 동기화 토큰이 만료되었습니다. 전체 재동기화가 필요합니다."
+            )
+
+        new_token = SyncToken(channel_id=token.channel_id, pts=difference.pts)
+        if isinstance(difference, ChannelDifferenceEmpty):
+            return MessageChanges(token=new_token, has_more=not difference.final)
+
+        added: dict[int, Message] = {}
+        edited: dict[int, Message] = {}
+        deleted_ids: set[int] = set()
+
+        for message in difference.new_messages:
+            if isinstance(message, TelethonMessage):
+                added[message.id] = TelegramMessageMapper.to_domain(TelegramMessageEntity.from_telethon(message))
+
+        for update in difference.other_updates:
+            if isinstance(update, UpdateEditChannelMessage) and isinstance(update.message, TelethonMessage):
+                # 같은 구간에서 추가된 메시지의 수정은 추가분의 최신 상태로 반영
+                target = added if update.message.id in added else edited
+                target[update.message.id] = TelegramMessageMapper.to_domain(
+                    TelegramMessageEntity.from_telethon(update.message)
+                )
+            elif isinstance(update, UpdateDeleteChannelMessages):
+                deleted_ids.update(update.messages)
+
+        return MessageChanges(
+            token=new_token,
+            added=[message for message_id, message in added.items() if message_id not in deleted_ids],
+            edited=[message for message_id, message in edited.items() if message_id not in deleted_ids],
+            deleted_ids=sorted(deleted_ids),
+            has_more=not difference.final,
+        )
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
 
-from src.domain.entities.message import Message
+from src.domain.entities.message import Message, MessageField
 
 
 class MessageRetrievalUseCase(ABC):
@@ -10,12 +10,13 @@ class MessageRetrievalUseCase(ABC):
     """
 
     @abstractmethod
-    async def get_latest_message(self, channel_id: str) -> Message:
+    async def get_latest_message(self, channel_id: str, fields: frozenset[MessageField] = frozenset()) -> Message:
         """
         Message 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             Message: 채널의 가장 최근 메시지
@@ -25,26 +26,47 @@ class MessageRetrievalUseCase(ABC):
         """
 
     @abstractmethod
-    async def get_messages_by_date(self, channel_id: str, date: date) -> list[Message]:
+    async def get_messages_by_date(
+        self, channel_id: str, date: date, fields: frozenset[MessageField] = frozenset(), dedupe: bool = False
+    ) -> list[Message]:
         """
         특정 날짜의 채널 메시지 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
             date: 일자 (YYYY-MM-DD)
+            fields: 기본 필드 외에 계산할 필드 그룹
+            dedupe: 유사 중복 메시지는 클러스터 대표(채널과 무관하게 처음 조회된 메시지)만 반환할지 여부
 
         Returns:
             list[Message]: 해당 날짜의 메시지 목록
         """
 
     @abstractmethod
-    async def get_yesterday_messages(self, channel_id: str) -> list[Message]:
+    async def get_yesterday_messages(
+        self, channel_id: str, fields: frozenset[MessageField] = frozenset(), dedupe: bool = False
+    ) -> list[Message]:
         """
         어제의 채널 메시지 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
+            dedupe: 유사 중복 메시지는 클러스터 대표(채널과 무관하게 처음 조회된 메시지)만 반환할지 여부
 
         Returns:
             list[Message]: 어제의 메시지 목록
         """
+
+    @abstractmethod
+    async def estimate_message_count_by_date(self, channel_id: str, date: date) -> int:
+        """
+        특정 날짜의 채널 메시지 수 추정 (메시지를 조회하지 않음)
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            date: 일자 (YYYY-MM-DD)
+
+        Returns:
+            int: 해당 날짜의 메시지 수 (삭제된 메시지를 포함할 수 있는 상한)
+        """
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from src.domain.entities.rollup import DailyRollup
+
+
+class DailyRollupUseCase(ABC):
+    """
+    채널별 일간 집계 조회를 담당하는 Use Case
+    """
+
+    @abstractmethod
+    async def get_daily_rollups(self, channel_ids: list[str], start_date: date, end_date: date) -> list[DailyRollup]:
+        """
+        여러 채널의 기간별 일간 집계 조회
+
+        refresh_daily_rollups()가 저장해 둔 집계만 읽으므로 텔레그램을 조회하지 않는다.
+
+        Args:
+            channel_ids: 채널 username (@python) 또는 ID 목록
+            start_date: 시작 일자 (YYYY-MM-DD)
+            end_date: 종료 일자 (YYYY-MM-DD, 포함)
+
+        Returns:
+            list[DailyRollup]: 채널/일자별 집계 목록 (집계되지 않은 일자는 제외)
+
+        Raises:
+            InvalidDateRangeError: 조회 기간이 올바르지 않을 경우
+        """
+
+    @abstractmethod
+    async def refresh_daily_rollups(self, channel_ids: list[str]) -> None:
+        """
+        채널별로 마감된(어제까지의) KST 일자의 집계를 계산하고, 늦게 도착한 수정/삭제가 있는 일자의 집계를 다시 계산
+
+        집계는 일자별로 한 번만 계산해 저장하며, KST 일자가 마감된 뒤 백그라운드 작업에서 주기적으로 호출한다.
+
+        Args:
+            channel_ids: 채널 username (@python) 또는 ID 목록
+        """
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.sync import MessageChanges
+
+
+class MessageSyncUseCase(ABC):
+    """
+    Message 변경분 동기화를 담당하는 Use Case
+    """
+
+    @abstractmethod
+    async def get_changes(self, channel_id: str, token: str | None = None) -> MessageChanges:
+        """
+        동기화 토큰 이후 추가/수정/삭제된 채널 메시지 조회
+
+        토큰 없이 호출하면 변경분 없이 현재 시점의 토큰만 발급한다.
+        레플리카는 토큰을 먼저 발급받은 뒤 전체 조회를 수행해야 그 사이의 변경을 놓치지 않는다.
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 이전 응답에서 받은 동기화 토큰
+
+        Returns:
+            MessageChanges: 토큰 이후의 변경분과 새 토큰
+
+        Raises:
+            InvalidSyncTokenError: 토큰이 올바르지 않을 경우
+            SyncTokenExpiredError: 토큰이 너무 오래되었을 경우
+        """
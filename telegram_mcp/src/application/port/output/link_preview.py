@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.link import LinkPreview
+
+
+class LinkPreviewPort(ABC):
+    """
+    링크 미리보기 조회를 담당하는 Output Port
+    """
+
+    @abstractmethod
+    async def fetch_previews(self, urls: list[str]) -> dict[str, LinkPreview]:
+        """
+        URL별 링크 미리보기 조회
+
+        같은 문서를 가리키는 URL(정규화 결과가 같은 URL)은 한 번만 가져온다.
+
+        Args:
+            urls: 조회할 URL 목록
+
+        Returns:
+            dict[str, LinkPreview]: 입력 URL별 미리보기 (가져오지 못한 URL은 제외)
+        """
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-from src.domain.entities.message import Message
+from src.domain.entities.message import Message, MessageField
+from src.domain.entities.sync import MessageChanges, SyncToken
 
 
 class MessagePort(ABC):
@@ -12,12 +13,13 @@ class MessagePort(ABC):
     """
 
     @abstractmethod
-    async def find_latest_by_channel(self, channel_id: str) -> Message:
+    async def find_latest_by_channel(self, channel_id: str, fields: frozenset[MessageField] = frozenset()) -> Message:
         """
         채널의 가장 최근 메시지 1개 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             Message: 채널의 가장 최근 메시지
@@ -28,7 +30,11 @@ class MessagePort(ABC):
 
     @abstractmethod
     async def find_by_channel_and_date_range(
-        self, channel_id: str, start_ts: datetime, end_ts: datetime
+        self,
+        channel_id: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        fields: frozenset[MessageField] = frozenset(),
     ) -> list[Message]:
         """
         특정 날짜의 채널 메시지 조회
@@ -37,7 +43,53 @@ class MessagePort(ABC):
             channel_id: 채널 username (@python) 또는 ID
             start_ts: 시작 타임스탬프
             end_ts: 종료 타임스탬프
+            fields: 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             List[Message]: 해당 날짜 범위의 메시지 목록
         """
+
+    @abstractmethod
+    async def estimate_count_by_channel_and_date_range(
+        self, channel_id: str, start_ts: datetime, end_ts: datetime
+    ) -> int:
+        """
+        특정 날짜 범위의 채널 메시지 수 추정
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            start_ts: 시작 타임스탬프
+            end_ts: 종료 타임스탬프
+
+        Returns:
+            int: 범위 내 메시지 수 (삭제된 메시지를 포함할 수 있는 상한)
+        """
+
+    @abstractmethod
+    async def get_sync_token(self, channel_id: str) -> SyncToken:
+        """
+        채널의 현재 시점 동기화 토큰 발급
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            SyncToken: 현재 시점의 동기화 토큰
+        """
+
+    @abstractmethod
+    async def find_changes_since(self, channel_id: str, token: SyncToken) -> MessageChanges:
+        """
+        동기화 토큰 이후 추가/수정/삭제된 채널 메시지 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 마지막 동기화 토큰
+
+        Returns:
+            MessageChanges: 토큰 이후의 변경분과 새 토큰
+
+        Raises:
+            InvalidSyncTokenError: 다른 채널의 토큰일 경우
+            SyncTokenExpiredError: 토큰이 너무 오래되었을 경우
+        """
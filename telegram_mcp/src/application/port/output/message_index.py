@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class MessageIndexPort(ABC):
+    """
+    채널별 시간 경계 → 메시지 ID 인덱스를 담당하는 Output Port
+
+    경계 시각 B의 값은 B 이전(date < B)에 작성된 마지막 메시지 ID이다. (없으면 0)
+    따라서 [start, end) 구간의 메시지는 ID가 (index[start], index[end]] 범위에 있다.
+    """
+
+    @abstractmethod
+    async def get_boundaries(self, peer_id: int, boundaries: list[datetime]) -> dict[datetime, int]:
+        """
+        경계 시각별 메시지 ID 조회
+
+        Args:
+            peer_id: 채널 peer ID (username과 ID 표기 모두 같은 값)
+            boundaries: 조회할 경계 시각 목록
+
+        Returns:
+            dict[datetime, int]: 인덱스에 기록된 경계 시각별 메시지 ID (기록되지 않은 경계는 제외)
+        """
+
+    @abstractmethod
+    async def record_boundaries(self, peer_id: int, boundaries: dict[datetime, int]) -> None:
+        """
+        경계 시각별 메시지 ID 기록
+
+        Args:
+            peer_id: 채널 peer ID (username과 ID 표기 모두 같은 값)
+            boundaries: 경계 시각별 메시지 ID
+        """
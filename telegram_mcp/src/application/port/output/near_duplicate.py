@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.message import Message
+
+
+class NearDuplicatePort(ABC):
+    """
+    채널 간 유사 중복 메시지 판별을 담당하는 Output Port
+    """
+
+    @abstractmethod
+    def assign_clusters(self, messages: list[Message]) -> list[Message]:
+        """
+        메시지를 인덱스에 추가하고 유사 중복 클러스터 ID를 부여
+
+        같은 메시지를 다시 추가하면 처음 부여한 클러스터 ID를 그대로 돌려준다.
+        이벤트 루프 밖의 스레드에서 호출되므로 구현체는 동시 호출에 안전해야 한다.
+
+        Args:
+            messages: 클러스터를 부여할 메시지 목록
+
+        Returns:
+            list[Message]: cluster_id가 채워진 메시지 목록 (본문이 너무 짧으면 None)
+        """
+
+    @abstractmethod
+    def find_representatives(self, cluster_ids: set[int]) -> dict[int, tuple[int, int]]:
+        """
+        클러스터별 대표 메시지 조회
+
+        대표는 클러스터에서 처음 인덱스에 추가된 메시지이며, 다른 채널의 메시지일 수 있다.
+
+        Args:
+            cluster_ids: 조회할 클러스터 ID 목록
+
+        Returns:
+            dict[int, tuple[int, int]]: 클러스터 ID별 대표 메시지 (peer_id, message_id) (인덱스에서 밀려난 클러스터는 제외)
+        """
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from datetime import date
+
+from src.domain.entities.rollup import DailyRollup
+
+
+class DailyRollupPort(ABC):
+    """
+    채널별 일간 집계 저장을 담당하는 Output Port
+    """
+
+    @abstractmethod
+    async def find_by_channel_and_dates(self, channel_id: str, dates: list[date]) -> dict[date, DailyRollup]:
+        """
+        저장된 일간 집계 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            dates: 조회할 일자 목록
+
+        Returns:
+            dict[date, DailyRollup]: 저장된 일자별 집계 (저장되지 않은 일자는 제외)
+        """
+
+    @abstractmethod
+    async def find_all_by_channel(self, channel_id: str) -> list[DailyRollup]:
+        """
+        채널의 저장된 일간 집계 전체 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            list[DailyRollup]: 저장된 집계 목록
+        """
+
+    @abstractmethod
+    async def save_all(self, rollups: list[DailyRollup]) -> None:
+        """
+        일간 집계 저장 (같은 채널/일자는 덮어씀)
+
+        Args:
+            rollups: 저장할 집계 목록
+        """
+
+    @abstractmethod
+    async def get_sync_token(self, channel_id: str) -> str | None:
+        """
+        집계 이후 변경분 확인에 사용할 채널 동기화 토큰 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+
+        Returns:
+            str | None: 저장된 동기화 토큰 (없으면 None)
+        """
+
+    @abstractmethod
+    async def save_sync_token(self, channel_id: str, token: str) -> None:
+        """
+        채널 동기화 토큰 저장
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 동기화 토큰
+        """
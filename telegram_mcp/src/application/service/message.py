@@ -1,9 +1,13 @@
+import asyncio
+from dataclasses import replace
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from src.application.port.input.message import MessageRetrievalUseCase
+from src.application.port.output.link_preview import LinkPreviewPort
 from src.application.port.output.message import MessagePort
-from src.domain.entities.message import Message
+from src.application.port.output.near_duplicate import NearDuplicatePort
+from src.domain.entities.message import Message, MessageField
 
 
 class MessageService(MessageRetrievalUseCase):
@@ -11,18 +15,26 @@ class MessageService(MessageRetrievalUseCase):
     Message 조회를 담당하는 Service
     """
 
-    def __init__(self, message_repository: MessagePort):
+    def __init__(
+        self,
+        message_repository: MessagePort,
+        near_duplicate_index: NearDuplicatePort | None = None,
+        link_preview_repository: LinkPreviewPort | None = None,
+    ):
         """
         MessageService 초기화
         """
         self.message_repository = message_repository
+        self.near_duplicate_index = near_duplicate_index
+        self.link_preview_repository = link_preview_repository
 
-    async def get_latest_message(self, channel_id: str) -> Message:
+    async def get_latest_message(self, channel_id: str, fields: frozenset[MessageField] = frozenset()) -> Message:
         """
         채널의 가장 최근 메시지 1개 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
 
         Returns:
             Message: 채널의 가장 최근 메시지
@@ -30,33 +42,112 @@ class MessageService(MessageRetrievalUseCase):
         Raises:
             MessageNotFoundError: 채널의 메시지가 없을 경우
         """
-        return await self.message_repository.find_latest_by_channel(channel_id)
+        message = await self.message_repository.find_latest_by_channel(channel_id, fields)
+        return (await self._enrich_links([message], fields))[0]
 
-    async def get_messages_by_date(self, channel_id: str, date: date) -> list[Message]:
+    async def get_messages_by_date(
+        self, channel_id: str, date: date, fields: frozenset[MessageField] = frozenset(), dedupe: bool = False
+    ) -> list[Message]:
         """
         특정 날짜의 채널 메시지 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
             date: 일자 (YYYY-MM-DD)
+            fields: 기본 필드 외에 계산할 필드 그룹
+            dedupe: 유사 중복 메시지는 클러스터 대표(채널과 무관하게 처음 조회된 메시지)만 반환할지 여부
 
         Returns:
             list[Message]: 해당 날짜의 메시지 목록
         """
-        start_ts = datetime.combine(date, datetime.min.time()).replace(tzinfo=ZoneInfo("Asia/Seoul"))
-        end_ts = start_ts + timedelta(days=1)
-        return await self.message_repository.find_by_channel_and_date_range(channel_id, start_ts, end_ts)
+        start_ts, end_ts = self.day_range(date)
+        messages = await self.message_repository.find_by_channel_and_date_range(channel_id, start_ts, end_ts, fields)
+        return await self._enrich_links(await self._cluster(messages, dedupe), fields)
 
-    async def get_yesterday_messages(self, channel_id: str) -> list[Message]:
+    async def get_yesterday_messages(
+        self, channel_id: str, fields: frozenset[MessageField] = frozenset(), dedupe: bool = False
+    ) -> list[Message]:
         """
         어제의 채널 메시지 조회
 
         Args:
             channel_id: 채널 username (@python) 또는 ID
+            fields: 기본 필드 외에 계산할 필드 그룹
+            dedupe: 유사 중복 메시지는 클러스터 대표(채널과 무관하게 처음 조회된 메시지)만 반환할지 여부
 
         Returns:
             list[Message]: 어제의 메시지 목록
         """
         end_ts = datetime.now(ZoneInfo("Asia/Seoul")).replace(hour=0, minute=0, second=0, microsecond=0)
         start_ts = end_ts - timedelta(days=1)
-        return await self.message_repository.find_by_channel_and_date_range(channel_id, start_ts, end_ts)
+        messages = await self.message_repository.find_by_channel_and_date_range(channel_id, start_ts, end_ts, fields)
+        return await self._enrich_links(await self._cluster(messages, dedupe), fields)
+
+    async def estimate_message_count_by_date(self, channel_id: str, date: date) -> int:
+        """
+        특정 날짜의 채널 메시지 수 추정 (메시지를 조회하지 않음)
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            date: 일자 (YYYY-MM-DD)
+
+        Returns:
+            int: 해당 날짜의 메시지 수 (삭제된 메시지를 포함할 수 있는 상한)
+        """
+        start_ts, end_ts = self.day_range(date)
+        return await self.message_repository.estimate_count_by_channel_and_date_range(channel_id, start_ts, end_ts)
+
+    @staticmethod
+    def day_range(date: date) -> tuple[datetime, datetime]:
+        """
+        KST 기준 하루의 시작/종료 타임스탬프
+
+        Args:
+            date: 일자 (YYYY-MM-DD)
+
+        Returns:
+            tuple[datetime, datetime]: [시작, 종료) 타임스탬프
+        """
+        start_ts = datetime.combine(date, datetime.min.time()).replace(tzinfo=ZoneInfo("Asia/Seoul"))
+        return start_ts, start_ts + timedelta(days=1)
+
+    async def _cluster(self, messages: list[Message], dedupe: bool) -> list[Message]:
+        """
+        유사 중복 클러스터 ID 부여 및 선택적 중복 제거
+
+        클러스터 계산은 CPU 작업이므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행한다.
+        중복 제거 시 클러스터 대표 메시지만 남기므로, 다른 채널에서 먼저 조회된 메시지의 중복도 제외된다.
+        """
+        if self.near_duplicate_index is None:
+            return messages
+
+        messages = await asyncio.to_thread(self.near_duplicate_index.assign_clusters, messages)
+        if not dedupe:
+            return messages
+
+        representatives = self.near_duplicate_index.find_representatives(
+            {message.cluster_id for message in messages if message.cluster_id is not None}
+        )
+        return [
+            message
+            for message in messages
+            if message.cluster_id is None
+            or representatives.get(message.cluster_id, (message.peer_id, message.id)) == (message.peer_id, message.id)
+        ]
+
+    async def _enrich_links(self, messages: list[Message], fields: frozenset[MessageField]) -> list[Message]:
+        """
+        요청 필드에 links가 포함된 경우 메시지 URL의 미리보기를 한 번에 조회해 채움
+        """
+        if MessageField.LINKS not in fields or self.link_preview_repository is None:
+            return messages
+
+        urls = list(dict.fromkeys(url for message in messages for url in message.urls))
+        if not urls:
+            return messages
+
+        previews = await self.link_preview_repository.fetch_previews(urls)
+        return [
+            replace(message, links=tuple(previews[url] for url in message.urls if url in previews))
+            for message in messages
+        ]
@@ -0,0 +1,151 @@
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from src.application.port.input.message import MessageRetrievalUseCase
+from src.application.port.input.rollup import DailyRollupUseCase
+from src.application.port.input.sync import MessageSyncUseCase
+from src.application.port.output.rollup import DailyRollupPort
+from src.domain.entities.rollup import DailyRollup
+from src.infrastructure.exception import InvalidDateRangeError, SyncTokenExpiredError
+
+
+class DailyRollupService(DailyRollupUseCase):
+    """
+    채널별 일간 집계 조회를 담당하는 Service
+    """
+
+    # 한 번에 조회할 수 있는 최대 일수
+    MAX_DAYS = 92
+    # 집계가 없으면 계산할 최근 마감 일수 (처음 실행하거나 실행이 밀린 경우)
+    BACKFILL_DAYS = 7
+    # 한 번의 갱신에서 다시 계산할 채널별 최대 stale 집계 수 (FloodWait 방지)
+    STALE_REFRESH_LIMIT = 3
+
+    def __init__(
+        self,
+        message_service: MessageRetrievalUseCase,
+        message_sync_service: MessageSyncUseCase,
+        rollup_repository: DailyRollupPort,
+    ):
+        """
+        DailyRollupService 초기화
+        """
+        self.message_service = message_service
+        self.message_sync_service = message_sync_service
+        self.rollup_repository = rollup_repository
+
+    async def get_daily_rollups(self, channel_ids: list[str], start_date: date, end_date: date) -> list[DailyRollup]:
+        """
+        여러 채널의 기간별 일간 집계 조회
+
+        저장된 집계만 읽으며, 집계 계산과 변경분 반영은 refresh_daily_rollups()가 담당한다.
+
+        Args:
+            channel_ids: 채널 username (@python) 또는 ID 목록
+            start_date: 시작 일자 (YYYY-MM-DD)
+            end_date: 종료 일자 (YYYY-MM-DD, 포함)
+
+        Returns:
+            list[DailyRollup]: 채널/일자별 집계 목록 (집계되지 않은 일자는 제외)
+
+        Raises:
+            InvalidDateRangeError: 조회 기간이 올바르지 않을 경우
+        """
+        if end_date < start_date or (end_date - start_date).days >= self.MAX_DAYS:
+            raise InvalidDateRangeError(f"조회 기간은 {self.MAX_DAYS}일 이내여야 합니다: {start_date} ~ {end_date}")
+
+        dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+        rollups = []
+        for channel_id in channel_ids:
+            stored = await self.rollup_repository.find_by_channel_and_dates(channel_id, dates)
+            rollups.extend(stored[day] for day in dates if day in stored)
+        return rollups
+
+    async def refresh_daily_rollups(self, channel_ids: list[str]) -> None:
+        """
+        채널별로 마감된 일자의 집계를 계산하고, 집계 이후 변경된 일자의 집계를 다시 계산
+
+        최근 BACKFILL_DAYS일 중 집계가 없는 마감 일자만 계산하므로,
+        일자가 바뀐 뒤 첫 실행에서는 직전 일자만 계산된다.
+        stale 집계는 실행마다 최근 일자부터 STALE_REFRESH_LIMIT개씩 다시 계산한다.
+
+        Args:
+            channel_ids: 채널 username (@python) 또는 ID 목록
+        """
+        last_closed_date = datetime.now(ZoneInfo("Asia/Seoul")).date() - timedelta(days=1)
+        dates = [last_closed_date - timedelta(days=offset) for offset in reversed(range(self.BACKFILL_DAYS))]
+
+        for channel_id in channel_ids:
+            await self._apply_changes(channel_id, dates[0])
+            await self._compute_missing(channel_id, dates)
+            await self._refresh_stale(channel_id)
+
+    async def _compute_missing(self, channel_id: str, dates: list[date]) -> None:
+        """
+        저장되지 않은 일자의 집계를 계산해 저장
+        """
+        stored = await self.rollup_repository.find_by_channel_and_dates(channel_id, dates)
+        missing_dates = [day for day in dates if day not in stored]
+        if not missing_dates:
+            return
+
+        # 집계 이후의 수정/삭제를 놓치지 않도록 집계 전에 동기화 토큰을 먼저 발급
+        if await self.rollup_repository.get_sync_token(channel_id) is None:
+            changes = await self.message_sync_service.get_changes(channel_id)
+            await self.rollup_repository.save_sync_token(channel_id, changes.token.encode())
+
+        await self.rollup_repository.save_all([await self._compute(channel_id, day) for day in missing_dates])
+
+    async def _apply_changes(self, channel_id: str, recent_date: date) -> None:
+        """
+        마지막 확인 이후 수정/삭제/추가된 메시지가 속한 일자의 집계만 다시 계산
+
+        동기화 토큰이 만료되면 recent_date 이후 집계만 바로 다시 계산하고, 그 이전 집계는 stale로 표시한다.
+        """
+        token = await self.rollup_repository.get_sync_token(channel_id)
+        if token is None:
+            return
+
+        stored = await self.rollup_repository.find_all_by_channel(channel_id)
+        affected_dates = set()
+
+        try:
+            has_more = True
+            while has_more:
+                changes = await self.message_sync_service.get_changes(channel_id, token)
+                affected_dates |= {message.ts.date() for message in changes.added + changes.edited}
+                affected_dates |= {
+                    rollup.date
+                    for rollup in stored
+                    if any(rollup.contains_id(message_id) for message_id in changes.deleted_ids)
+                }
+                token = changes.token.encode()
+                has_more = changes.has_more
+        except SyncTokenExpiredError:
+            # 변경분을 알 수 없으므로 최근 집계는 다시 계산하고, 오래된 집계는 stale로 표시해 나눠서 다시 계산
+            token = (await self.message_sync_service.get_changes(channel_id)).token.encode()
+            affected_dates = {rollup.date for rollup in stored if rollup.date >= recent_date}
+            await self.rollup_repository.save_all(
+                [replace(rollup, stale=True) for rollup in stored if rollup.date < recent_date and not rollup.stale]
+            )
+
+        affected_dates &= {rollup.date for rollup in stored}
+        await self.rollup_repository.save_all([await self._compute(channel_id, day) for day in sorted(affected_dates)])
+        await self.rollup_repository.save_sync_token(channel_id, token)
+
+    async def _refresh_stale(self, channel_id: str) -> None:
+        """
+        오래된(stale) 집계를 최근 일자부터 최대 STALE_REFRESH_LIMIT개 다시 계산
+        """
+        stale = [rollup for rollup in await self.rollup_repository.find_all_by_channel(channel_id) if rollup.stale]
+        dates = sorted((rollup.date for rollup in stale), reverse=True)[: self.STALE_REFRESH_LIMIT]
+        await self.rollup_repository.save_all([await self._compute(channel_id, day) for day in dates])
+
+    async def _compute(self, channel_id: str, day: date) -> DailyRollup:
+        """
+        하루치 메시지를 조회해 집계 계산
+        """
+        messages = await self.message_service.get_messages_by_date(channel_id, day)
+        return DailyRollup.from_messages(channel_id, day, messages)
@@ -0,0 +1,41 @@
+from src.application.port.input.sync import MessageSyncUseCase
+from src.application.port.output.message import MessagePort
+from src.domain.entities.sync import MessageChanges, SyncToken
+from src.infrastructure.exception import InvalidSyncTokenError
+
+
+class MessageSyncService(MessageSyncUseCase):
+    """
+    Message 변경분 동기화를 담당하는 Service
+    """
+
+    def __init__(self, message_repository: MessagePort):
+        """
+        MessageSyncService 초기화
+        """
+        self.message_repository = message_repository
+
+    async def get_changes(self, channel_id: str, token: str | None = None) -> MessageChanges:
+        """
+        동기화 토큰 이후 추가/수정/삭제된 채널 메시지 조회
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            token: 이전 응답에서 받은 동기화 토큰
+
+        Returns:
+            MessageChanges: 토큰 이후의 변경분과 새 토큰
+
+        Raises:
+            InvalidSyncTokenError: 토큰이 올바르지 않을 경우
+            SyncTokenExpiredError: 토큰이 너무 오래되었을 경우
+        """
+        if token is None:
+            return MessageChanges(token=await self.message_repository.get_sync_token(channel_id))
+
+        try:
+            sync_token = SyncToken.decode(token)
+        except ValueError as e:
+            raise InvalidSyncTokenError(str(e)) from e
+
+        return await self.message_repository.find_changes_since(channel_id, sync_token)
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+URL_PATTERN = re.compile(r"https?://[^\s<>\"'()\[\]]+")
+TRAILING_PUNCTUATION = ".,;:!?"
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "si"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def extract_urls(text: str | None) -> list[str]:
+    """
+    본문에서 http(s) URL 추출 (문장 끝 문장부호 제외, 등장 순서 유지, 중복 제거)
+    """
+    urls = (url.rstrip(TRAILING_PUNCTUATION) for url in URL_PATTERN.findall(text or ""))
+    return list(dict.fromkeys(urls))
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 문서를 가리키는 URL을 하나의 키로 정규화
+
+    scheme/host 소문자화, 기본 포트와 fragment 제거, 추적용 쿼리(utm_* 등) 제거 후 쿼리 정렬
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass(frozen=True)
+class LinkPreview:
+    """
+    링크 미리보기 (리다이렉트 이후 최종 URL과 페이지 제목/설명)
+    """
+
+    url: str
+    canonical_url: str
+    final_url: str | None = None
+    title: str | None = None
+    description: str | None = None
+
+    def to_dict(self) -> dict:
+        """
+        LinkPreview를 딕셔너리로 변환
+        """
+        return {
+            "url": self.url,
+            "canonical_url": self.canonical_url,
+            "final_url": self.final_url,
+            "title": self.title,
+            "description": self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LinkPreview":
+        """
+        to_dict()로 만든 딕셔너리를 LinkPreview로 복원
+        """
+        return cls(**data)
@@ -1,12 +1,29 @@
 from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
 from zoneinfo import ZoneInfo
 
+from src.domain.entities.link import LinkPreview
+
+
+class MessageField(StrEnum):
+    """
+    기본 필드 외에 요청 시에만 계산하는 메시지 필드 그룹
+    """
+
+    SENDER = "sender"
+    FORWARD = "forward"
+    REPLY = "reply"
+    MEDIA = "media"
+    LINKS = "links"
+
 
 @dataclass(frozen=True)
 class Message:
     """
     텔레그램 메시지 도메인 모델
+
+    fields에 포함된 필드 그룹만 계산되어 있으며, to_dict()도 해당 그룹만 포함한다.
     """
 
     id: int
@@ -14,18 +31,47 @@ class Message:
     peer_name: str
     peer_id: int
     _ts: datetime
+    _edit_ts: datetime | None = None
+    fields: frozenset[MessageField] = frozenset()
+    sender_id: int | None = None
+    sender_username: str | None = None
+    sender_first_name: str | None = None
+    forward_from_channel: str | None = None
+    _forward_ts: datetime | None = None
+    reply_to_message_id: int | None = None
+    media_type: str | None = None
+    cluster_id: int | None = None
+    urls: tuple[str, ...] = ()
+    links: tuple[LinkPreview, ...] = ()
 
     def to_dict(self) -> dict:
         """
         Message를 딕셔너리로 변환
         """
-        return {
+        data = {
             "id": self.id,
             "message": self.message,
             "ts": self.ts,
+            "edit_ts": self.edit_ts,
             "peer_id": self.peer_id,
             "peer_name": self.peer_name,
         }
+        if MessageField.SENDER in self.fields:
+            data["sender_id"] = self.sender_id
+            data["sender_username"] = self.sender_username
+            data["sender_first_name"] = self.sender_first_name
+        if MessageField.FORWARD in self.fields:
+            data["forward_from_channel"] = self.forward_from_channel
+            data["forward_ts"] = self.forward_ts
+        if MessageField.REPLY in self.fields:
+            data["reply_to_message_id"] = self.reply_to_message_id
+        if MessageField.MEDIA in self.fields:
+            data["media_type"] = self.media_type
+        if MessageField.LINKS in self.fields:
+            data["links"] = [link.to_dict() for link in self.links]
+        if self.cluster_id is not None:
+            data["cluster_id"] = self.cluster_id
+        return data
 
     @property
     def ts(self) -> datetime:
@@ -33,3 +79,21 @@ class Message:
         Message의 타임스탬프
         """
         return self._ts.astimezone(ZoneInfo("Asia/Seoul"))
+
+    @property
+    def edit_ts(self) -> datetime | None:
+        """
+        Message의 마지막 수정 타임스탬프 (수정된 적 없으면 None)
+        """
+        if self._edit_ts is None:
+            return None
+        return self._edit_ts.astimezone(ZoneInfo("Asia/Seoul"))
+
+    @property
+    def forward_ts(self) -> datetime | None:
+        """
+        전달된 메시지의 원본 타임스탬프 (전달 메시지가 아니면 None)
+        """
+        if self._forward_ts is None:
+            return None
+        return self._forward_ts.astimezone(ZoneInfo("Asia/Seoul"))
@@ -0,0 +1,103 @@
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+import re
+
+from src.domain.entities.link import extract_urls
+from src.domain.entities.message import Message
+
+TICKER_PATTERN = re.compile(r"(?<![\w$])\$([A-Za-z]{1,6})\b")
+
+
+@dataclass(frozen=True)
+class DailyRollup:
+    """
+    채널의 KST 하루치 메시지 집계
+
+    stale은 변경분을 확인할 수 없어 최신 수정/삭제가 반영되지 않았을 수 있는 집계를 뜻한다.
+    """
+
+    channel_id: str
+    date: date
+    count: int
+    hourly_counts: tuple[int, ...]
+    top_links: tuple[tuple[str, int], ...]
+    top_tickers: tuple[tuple[str, int], ...]
+    first_id: int = 0
+    last_id: int = 0
+    stale: bool = False
+
+    @classmethod
+    def from_messages(cls, channel_id: str, date: date, messages: list[Message], top_n: int = 10) -> "DailyRollup":
+        """
+        하루치 메시지 목록으로 집계 생성
+
+        Args:
+            channel_id: 채널 username (@python) 또는 ID
+            date: 일자 (KST)
+            messages: 해당 일자의 메시지 목록
+            top_n: 상위 링크/티커 개수
+
+        Returns:
+            DailyRollup: 하루치 집계
+        """
+        hourly_counts = [0] * 24
+        links = Counter()
+        tickers = Counter()
+
+        for message in messages:
+            hourly_counts[message.ts.hour] += 1
+            text = message.message or ""
+            links.update(extract_urls(text))
+            tickers.update(ticker.upper() for ticker in TICKER_PATTERN.findall(text))
+
+        ids = [message.id for message in messages]
+        return cls(
+            channel_id=channel_id,
+            date=date,
+            count=len(messages),
+            hourly_counts=tuple(hourly_counts),
+            top_links=tuple(links.most_common(top_n)),
+            top_tickers=tuple(tickers.most_common(top_n)),
+            first_id=min(ids, default=0),
+            last_id=max(ids, default=0),
+        )
+
+    def contains_id(self, message_id: int) -> bool:
+        """
+        메시지 ID가 이 집계의 범위에 속하는지 여부
+        """
+        return self.count > 0 and self.first_id <= message_id <= self.last_id
+
+    def to_dict(self) -> dict:
+        """
+        DailyRollup을 딕셔너리로 변환
+        """
+        return {
+            "channel_id": self.channel_id,
+            "date": self.date.isoformat(),
+            "count": self.count,
+            "hourly_counts": list(self.hourly_counts),
+            "top_links": [{"value": link, "count": count} for link, count in self.top_links],
+            "top_tickers": [{"value": ticker, "count": count} for ticker, count in self.top_tickers],
+            "first_id": self.first_id,
+            "last_id": self.last_id,
+            "stale": self.stale,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DailyRollup":
+        """
+        to_dict()로 만든 딕셔너리를 DailyRollup으로 복원
+        """
+        return cls(
+            channel_id=data["channel_id"],
+            date=date.fromisoformat(data["date"]),
+            count=data["count"],
+            hourly_counts=tuple(data["hourly_counts"]),
+            top_links=tuple((item["value"], item["count"]) for item in data["top_links"]),
+            top_tickers=tuple((item["value"], item["count"]) for item in data["top_tickers"]),
+            first_id=data["first_id"],
+            last_id=data["last_id"],
+            stale=data.get("stale", False),
+        )
@@ -0,0 +1,70 @@
+import base64
+from dataclasses import dataclass, field
+import json
+
+from src.domain.entities.message import Message
+
+
+@dataclass(frozen=True)
+class SyncToken:
+    """
+    채널별 변경분 동기화 토큰
+
+    Telegram 채널 업데이트 시퀀스(pts)를 기준으로 마지막 동기화 지점을 나타낸다.
+    """
+
+    channel_id: int
+    pts: int
+
+    def encode(self) -> str:
+        """
+        토큰을 URL-safe 문자열로 인코딩
+        """
+        raw = json.dumps({"c": self.channel_id, "p": self.pts}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncToken":
+        """
+        인코딩된 문자열을 토큰으로 복원
+
+        Args:
+            token: encode()로 만든 문자열
+
+        Returns:
+            SyncToken: 복원된 토큰
+
+        Raises:
+            ValueError: 토큰 형식이 올바르지 않을 경우
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(channel_id=int(payload["c"]), pts=int(payload["p"]))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"잘못된 동기화 토큰입니다: {token}") from e
+
+
+@dataclass(frozen=True)
+class MessageChanges:
+    """
+    동기화 토큰 이후의 채널 메시지 변경분
+    """
+
+    token: SyncToken
+    added: list[Message] = field(default_factory=list)
+    edited: list[Message] = field(default_factory=list)
+    deleted_ids: list[int] = field(default_factory=list)
+    has_more: bool = False
+
+    def to_dict(self) -> dict:
+        """
+        MessageChanges를 딕셔너리로 변환
+        """
+        return {
+            "token": self.token.encode(),
+            "added": [message.to_dict() for message in self.added],
+            "edited": [message.to_dict() for message in self.edited],
+            "deleted_ids": self.deleted_ids,
+            "has_more": self.has_more,
+        }
@@ -18,6 +18,30 @@ class Config(BaseSettings):
     TELEGRAM_API_ID: str = os.getenv("TELEGRAM_API_ID")
     TELEGRAM_API_HASH: str = os.getenv("TELEGRAM_API_HASH")
 
+    # 로컬 저장소 설정
+    MESSAGE_INDEX_PATH: str = os.getenv("MESSAGE_INDEX_PATH", "data/message_index.json")
+    DAILY_ROLLUP_PATH: str = os.getenv("DAILY_ROLLUP_PATH", "data/daily_rollup.json")
+
+    # 일간 집계 설정 (집계할 채널은 쉼표로 구분, 갱신 주기는 초 단위)
+    ROLLUP_CHANNEL_IDS: str = os.getenv("ROLLUP_CHANNEL_IDS", "")
+    ROLLUP_REFRESH_INTERVAL: int = int(os.getenv("ROLLUP_REFRESH_INTERVAL", "600"))
+
+    # 유사 중복 탐지 설정 (인덱스에 유지할 최근 메시지 수)
+    NEAR_DUPLICATE_CAPACITY: int = int(os.getenv("NEAR_DUPLICATE_CAPACITY", "100000"))
+
+    # 링크 미리보기 설정
+    LINK_PREVIEW_CACHE_PATH: str = os.getenv("LINK_PREVIEW_CACHE_PATH", "data/link_preview.json")
+    LINK_PREVIEW_CACHE_SIZE: int = int(os.getenv("LINK_PREVIEW_CACHE_SIZE", "50000"))
+    LINK_PREVIEW_PER_HOST_LIMIT: int = int(os.getenv("LINK_PREVIEW_PER_HOST_LIMIT", "4"))
+    LINK_PREVIEW_FLUSH_INTERVAL: int = int(os.getenv("LINK_PREVIEW_FLUSH_INTERVAL", "30"))
+
+    @property
+    def rollup_channel_ids(self) -> list[str]:
+        """
+        일간 집계를 계산할 채널 목록
+        """
+        return [channel_id.strip() for channel_id in self.ROLLUP_CHANNEL_IDS.split(",") if channel_id.strip()]
+
     def validate(self) -> None:
         """
         Config 유효성 검사
@@ -1,6 +1,12 @@
 from dependency_injector import containers, providers
+from src.adapter.outbound.file_storage.repository.message_index import JsonMessageIndexRepository
+from src.adapter.outbound.file_storage.repository.rollup import JsonDailyRollupRepository
+from src.adapter.outbound.http.repository.link_preview import HttpxLinkPreviewRepository
+from src.adapter.outbound.minhash.near_duplicate import MinHashNearDuplicateIndex
 from src.adapter.outbound.telegram_api.repository.message import TelegramMessageRepository
 from src.application.service.message import MessageService
+from src.application.service.rollup import DailyRollupService
+from src.application.service.sync import MessageSyncService
 from src.infrastructure.config import Config
 from src.infrastructure.telegram_client import TelegramClient
 
@@ -10,7 +16,9 @@ class Container(containers.DeclarativeContainer):
     애플리케이션의 의존성 주입 컨테이너
     """
 
-    wiring_config = containers.WiringConfiguration(modules=["src.adapter.inbound.web.routes.message"])
+    wiring_config = containers.WiringConfiguration(
+        modules=["src.adapter.inbound.web.routes.message", "src.adapter.inbound.web.routes.rollup"]
+    )
 
     config = providers.Singleton(Config)
 
@@ -21,12 +29,56 @@ class Container(containers.DeclarativeContainer):
         api_hash=config.provided.TELEGRAM_API_HASH,
     )
 
+    message_index_repository = providers.Singleton(
+        JsonMessageIndexRepository,
+        path=config.provided.MESSAGE_INDEX_PATH,
+    )
+
+    daily_rollup_repository = providers.Singleton(
+        JsonDailyRollupRepository,
+        path=config.provided.DAILY_ROLLUP_PATH,
+    )
+
+    near_duplicate_index = providers.Singleton(
+        MinHashNearDuplicateIndex,
+        capacity=config.provided.NEAR_DUPLICATE_CAPACITY,
+    )
+
+    link_preview_repository = providers.Singleton(
+        HttpxLinkPreviewRepository,
+        cache_path=config.provided.LINK_PREVIEW_CACHE_PATH,
+        cache_size=config.provided.LINK_PREVIEW_CACHE_SIZE,
+        per_host_limit=config.provided.LINK_PREVIEW_PER_HOST_LIMIT,
+        flush_interval=config.provided.LINK_PREVIEW_FLUSH_INTERVAL,
+    )
+
     message_repository = providers.Singleton(
         TelegramMessageRepository,
         telegram_client=telegram_client,
+        message_index=message_index_repository,
     )
 
     message_service = providers.Factory(
         MessageService,
         message_repository=message_repository,
+        near_duplicate_index=near_duplicate_index,
+        link_preview_repository=link_preview_repository,
+    )
+
+    # 일간 집계 백필 조회가 유사 중복 인덱스를 채우지 않도록 인덱스 없이 구성
+    rollup_message_service = providers.Factory(
+        MessageService,
+        message_repository=message_repository,
+    )
+
+    message_sync_service = providers.Factory(
+        MessageSyncService,
+        message_repository=message_repository,
+    )
+
+    daily_rollup_service = providers.Factory(
+        DailyRollupService,
+        message_service=rollup_message_service,
+        message_sync_service=message_sync_service,
+        rollup_repository=daily_rollup_repository,
     )
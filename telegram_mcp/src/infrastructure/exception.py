@@ -2,3 +2,23 @@ class MessageNotFoundError(Exception):
     """
     메시지가 없을 경우 발생하는 예외
     """
+
+
+class InvalidSyncTokenError(Exception):
+    """
+    동기화 토큰이 올바르지 않거나 다른 채널의 토큰일 경우 발생하는 예외
+    """
+
+
+class SyncTokenExpiredError(Exception):
+    """
+    동기화 토큰이 너무 오래되어 변경분을 제공할 수 없을 경우 발생하는 예외
+
+    전체 재동기화 후 새 토큰을 발급받아야 한다.
+    """
+
+
+class InvalidDateRangeError(Exception):
+    """
+    조회 기간이 올바르지 않을 경우 발생하는 예외
+    """
@@ -13,6 +13,8 @@ class TelegramClient:
         self.api_id = api_id
         self.api_hash = api_hash
         self._client: Optional[TelethonClient] = None
+        # 중첩된 async with 깊이 (가장 바깥 블록을 벗어날 때만 연결 해제)
+        self._depth = 0
 
     async def connect(self) -> None:
         """
@@ -58,6 +60,7 @@ class TelegramClient:
         비동기 컨텍스트 매니저 진입
         """
         await self.connect()
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -65,4 +68,6 @@ class TelegramClient:
         비동기 컨텍스트 매니저 종료
         """
         print("__aexit__")
-        await self.disconnect()
+        self._depth -= 1
+        if self._depth == 0:
+            await self.disconnect()
@@ -1,16 +1,52 @@
-from fastapi import APIRouter, FastAPI
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 
+from fastapi import APIRouter, FastAPI
+from src.adapter.inbound.scheduler.rollup import run_daily_rollup_job
+from src.adapter.inbound.web.exception_handler import register_exception_handlers
 from src.adapter.inbound.web.routes.health import router as health_router
 from src.adapter.inbound.web.routes.message import router as message_router
+from src.adapter.inbound.web.routes.rollup import router as rollup_router
 from src.infrastructure.container import Container
 
 container = Container()
 
-app = FastAPI(title="Telegram MCP Server", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    앱 시작 시 일간 집계 백그라운드 작업을 시작하고, 종료 시 작업 중지 및 링크 미리보기 캐시 저장/연결 풀 종료
+    """
+    config = container.config()
+    job = None
+    if config.rollup_channel_ids:
+        job = asyncio.create_task(
+            run_daily_rollup_job(
+                container.daily_rollup_service(),
+                container.telegram_client(),
+                config.rollup_channel_ids,
+                config.ROLLUP_REFRESH_INTERVAL,
+            )
+        )
+
+    yield
+
+    if job is not None:
+        job.cancel()
+        with suppress(asyncio.CancelledError):
+            await job
+
+    await container.link_preview_repository().aclose()
+
+
+app = FastAPI(title="Telegram MCP Server", version="0.1.0", lifespan=lifespan)
 app.container = container
+register_exception_handlers(app)
 
 api_v1_router = APIRouter(prefix="/api/v1")
 api_v1_router.include_router(health_router)
 api_v1_router.include_router(message_router)
+api_v1_router.include_router(rollup_router)
 
 app.include_router(api_v1_router)
@@ -1,6 +1,7 @@
 import pytest
 import sys
 from pathlib import Path
+from datetime import datetime, timezone
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
@@ -29,4 +30,57 @@ def mock_telegram_message():
     mock_peer.to_dict.return_value = {"_": "PeerChannel", "channel_id": 67890}
     mock_message.peer_id = mock_peer
     
-    return mock_message
\ No newline at end of file
+    return mock_message
+
+
+@pytest.fixture
+def mock_telegram_client():
+    """공통 텔레그램 클라이언트 모킹 fixture (async with 지원)"""
+    from unittest.mock import AsyncMock
+
+    mock_client = AsyncMock()
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    return mock_client
+
+
+@pytest.fixture
+def telethon_message():
+    """테스트용 Telethon 메시지 생성 함수 fixture (채널 67890의 메시지, 응답에 엔티티가 포함되지 않은 상태)"""
+    from telethon.tl.types import Message, MessageFwdHeader, MessageReplyHeader, PeerChannel, PeerUser
+
+    def _telethon_message(
+        message_id,
+        text=None,
+        date=datetime(2025, 1, 1, 3, 0, 0, tzinfo=timezone.utc),
+        edit_date=None,
+        from_user_id=None,
+        fwd_channel_id=None,
+        reply_to=None,
+    ):
+        fwd_from = None
+        if fwd_channel_id:
+            fwd_from = MessageFwdHeader(date=date, from_id=PeerChannel(channel_id=fwd_channel_id))
+        return Message(
+            id=message_id,
+            peer_id=PeerChannel(channel_id=67890),
+            date=date,
+            message=f"메시지 {message_id}" if text is None else text,
+            edit_date=edit_date,
+            from_id=PeerUser(user_id=from_user_id) if from_user_id else None,
+            fwd_from=fwd_from,
+            reply_to=MessageReplyHeader(reply_to_msg_id=reply_to) if reply_to else None,
+        )
+
+    return _telethon_message
+
+
+@pytest.fixture
+def aiter_of():
+    """리스트를 비동기 이터레이터로 변환하는 함수 fixture (iter_messages 모킹용)"""
+
+    async def _aiter(items):
+        for item in items:
+            yield item
+
+    return _aiter
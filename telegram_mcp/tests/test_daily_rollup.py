@@ -0,0 +1,231 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapter.inbound.scheduler.rollup import run_daily_rollup_job
+from src.adapter.inbound.web.exception_handler import register_exception_handlers
+from src.adapter.outbound.file_storage.repository.rollup import JsonDailyRollupRepository
+from src.application.service.rollup import DailyRollupService
+from src.domain.entities.message import Message
+from src.domain.entities.rollup import DailyRollup
+from src.domain.entities.sync import MessageChanges, SyncToken
+from src.infrastructure.config import Config
+from src.infrastructure.container import Container
+from src.infrastructure.exception import InvalidDateRangeError, SyncTokenExpiredError
+from src.infrastructure.telegram_client import TelegramClient
+
+KST = ZoneInfo("Asia/Seoul")
+YESTERDAY = datetime.now(KST).date() - timedelta(days=1)
+
+
+def _message(message_id, text, day=YESTERDAY, hour=9):
+    """테스트용 도메인 메시지 생성"""
+    return Message(
+        id=message_id,
+        message=text,
+        peer_name="PeerChannel",
+        peer_id=67890,
+        _ts=datetime(day.year, day.month, day.day, hour, tzinfo=KST),
+    )
+
+
+class TestDailyRollup:
+    """DailyRollup 단위 테스트"""
+
+    def test_from_messages(self):
+        """메시지 수, 시간대별 분포, 상위 링크/티커 집계 테스트"""
+        messages = [
+            _message(3, "$tsla 급등 https://news.example.com/a.", hour=9),
+            _message(2, "$TSLA $NVDA https://news.example.com/a", hour=9),
+            _message(1, "가격이 $100 입니다", hour=23),
+        ]
+
+        rollup = DailyRollup.from_messages("@test_channel", YESTERDAY, messages)
+
+        assert rollup.count == 3
+        assert rollup.hourly_counts[9] == 2
+        assert rollup.hourly_counts[23] == 1
+        assert rollup.top_links == (("https://news.example.com/a", 2),)
+        assert rollup.top_tickers == (("TSLA", 2), ("NVDA", 1))
+        assert (rollup.first_id, rollup.last_id) == (1, 3)
+        assert DailyRollup.from_dict(rollup.to_dict()) == rollup
+
+
+class TestDailyRollupService:
+    """DailyRollupService 단위 테스트"""
+
+    @pytest.fixture
+    def message_service(self):
+        """일자별 메시지 조회 모킹"""
+        message_service = AsyncMock()
+        message_service.get_messages_by_date.return_value = [_message(1, "$TSLA")]
+        return message_service
+
+    @pytest.fixture
+    def message_sync_service(self):
+        """변경분 조회 모킹 (변경 없음)"""
+        message_sync_service = AsyncMock()
+        message_sync_service.get_changes.return_value = MessageChanges(token=SyncToken(channel_id=67890, pts=1))
+        return message_sync_service
+
+    @pytest.fixture
+    def service(self, message_service, message_sync_service, tmp_path):
+        """테스트용 서비스 인스턴스"""
+        return DailyRollupService(
+            message_service, message_sync_service, JsonDailyRollupRepository(str(tmp_path / "rollup.json"))
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_computes_closed_days_once(self, service, message_service):
+        """백그라운드 갱신이 마감된 일자 집계를 한 번만 계산하는지 테스트"""
+        # When
+        await service.refresh_daily_rollups(["@test_channel"])
+        await service.refresh_daily_rollups(["@test_channel"])
+
+        # Then
+        assert message_service.get_messages_by_date.call_count == DailyRollupService.BACKFILL_DAYS
+        message_service.get_messages_by_date.assert_called_with("@test_channel", YESTERDAY)
+
+    @pytest.mark.asyncio
+    async def test_get_reads_store_only(self, service, message_service, message_sync_service):
+        """조회는 저장된 집계만 읽고 텔레그램을 조회하지 않는지 테스트"""
+        # Given
+        empty = await service.get_daily_rollups(["@test_channel"], YESTERDAY, YESTERDAY)
+        await service.refresh_daily_rollups(["@test_channel"])
+        message_service.reset_mock()
+        message_sync_service.reset_mock()
+
+        # When
+        rollups = await service.get_daily_rollups(
+            ["@test_channel", "@other_channel"], YESTERDAY, YESTERDAY + timedelta(days=1)
+        )
+
+        # Then
+        assert empty == []
+        assert [(rollup.channel_id, rollup.date) for rollup in rollups] == [("@test_channel", YESTERDAY)]
+        message_service.get_messages_by_date.assert_not_called()
+        message_sync_service.get_changes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_late_changes_recompute_only_affected_days(self, service, message_service, message_sync_service):
+        """늦게 도착한 수정/삭제가 있는 일자만 다시 계산되는지 테스트"""
+        # Given
+        before_yesterday = YESTERDAY - timedelta(days=1)
+        await service.refresh_daily_rollups(["@test_channel"])
+        message_service.get_messages_by_date.reset_mock()
+        message_service.get_messages_by_date.return_value = [_message(1, "$NVDA")]
+        message_sync_service.get_changes.return_value = MessageChanges(
+            token=SyncToken(channel_id=67890, pts=2), edited=[_message(1, "$NVDA")]
+        )
+
+        # When
+        await service.refresh_daily_rollups(["@test_channel"])
+        rollups = await service.get_daily_rollups(["@test_channel"], before_yesterday, YESTERDAY)
+
+        # Then
+        message_service.get_messages_by_date.assert_called_once_with("@test_channel", YESTERDAY)
+        assert rollups[1].top_tickers == (("NVDA", 1),)
+
+    @pytest.mark.asyncio
+    async def test_expired_token_recomputes_recent_days_and_marks_older_stale(
+        self, service, message_service, message_sync_service
+    ):
+        """토큰 만료 시 최근 BACKFILL_DAYS일만 다시 계산하고, 이전 집계는 stale로 표시해 나눠서 계산하는지 테스트"""
+        # Given
+        days = [YESTERDAY - timedelta(days=offset) for offset in range(30)]
+        await service.rollup_repository.save_all([DailyRollup.from_messages("@test_channel", day, []) for day in days])
+        await service.rollup_repository.save_sync_token("@test_channel", "expired")
+        new_changes = MessageChanges(token=SyncToken(channel_id=67890, pts=2))
+
+        async def get_changes(channel_id, token=None):
+            if token == "expired":
+                raise SyncTokenExpiredError("만료")
+            return new_changes
+
+        message_sync_service.get_changes.side_effect = get_changes
+
+        # When
+        await service.refresh_daily_rollups(["@test_channel"])
+        first_run = [call.args[1] for call in message_service.get_messages_by_date.call_args_list]
+        message_service.get_messages_by_date.reset_mock()
+        await service.refresh_daily_rollups(["@test_channel"])
+        second_run = [call.args[1] for call in message_service.get_messages_by_date.call_args_list]
+
+        # Then
+        recent, older = days[: DailyRollupService.BACKFILL_DAYS], days[DailyRollupService.BACKFILL_DAYS :]
+        limit = DailyRollupService.STALE_REFRESH_LIMIT
+        assert sorted(first_run, reverse=True) == recent + older[:limit]
+        assert second_run == older[limit : limit * 2]
+        rollups = await service.rollup_repository.find_by_channel_and_dates("@test_channel", days)
+        assert [day for day in days if rollups[day].stale] == older[limit * 2 :]
+        assert rollups[YESTERDAY].count == 1
+
+    def test_backfill_does_not_use_near_duplicate_index(self):
+        """집계용 메시지 조회는 유사 중복 인덱스를 거치지 않는지 테스트"""
+        container = Container()
+        container.config.override(providers.Object(Config(TELEGRAM_API_ID="1", TELEGRAM_API_HASH="test")))
+        container.telegram_client.override(providers.Object(MagicMock()))
+
+        service = container.daily_rollup_service()
+
+        assert service.message_service.near_duplicate_index is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_date_range(self, service):
+        """조회 기간이 MAX_DAYS를 넘으면 예외 발생 테스트"""
+        with pytest.raises(InvalidDateRangeError):
+            await service.get_daily_rollups(["@test_channel"], YESTERDAY - timedelta(days=92), YESTERDAY)
+
+    def test_invalid_date_range_is_bad_request(self):
+        """InvalidDateRangeError가 400 ErrorResponse로 변환되는지 테스트"""
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/rollup")
+        async def rollup():
+            raise InvalidDateRangeError("조회 기간은 92일 이내여야 합니다: 2025-01-01 ~ 2025-12-31")
+
+        response = TestClient(app).get("/rollup")
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "InvalidDateRangeError"
+
+
+class TestDailyRollupJob:
+    """일간 집계 백그라운드 작업 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_refreshes_within_one_connection_and_survives_errors(self, mock_telegram_client):
+        """실행마다 연결을 한 번만 열고, 실패해도 다음 주기에 다시 실행되는지 테스트"""
+        # Given
+        use_case = AsyncMock()
+        use_case.refresh_daily_rollups.side_effect = [RuntimeError("telegram down"), None, asyncio.CancelledError()]
+
+        # When
+        with pytest.raises(asyncio.CancelledError):
+            await run_daily_rollup_job(use_case, mock_telegram_client, ["@test_channel"], interval=0)
+
+        # Then
+        assert use_case.refresh_daily_rollups.call_count == 3
+        use_case.refresh_daily_rollups.assert_called_with(["@test_channel"])
+        assert mock_telegram_client.__aenter__.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_nested_client_context_disconnects_once(self):
+        """작업 중 중첩된 조회가 연결을 끊지 않고, 가장 바깥 블록에서만 연결 해제되는지 테스트"""
+        client = TelegramClient("test-session", "1", "hash")
+        client.connect = AsyncMock()
+        client.disconnect = AsyncMock()
+
+        async with client:
+            async with client:
+                pass
+            client.disconnect.assert_not_called()
+
+        client.disconnect.assert_called_once()
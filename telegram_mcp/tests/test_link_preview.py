@@ -0,0 +1,295 @@
+import asyncio
+import contextlib
+import pytest
+import pytest_asyncio
+from datetime import datetime, timezone
+
+import httpcore
+import httpx
+from telethon.tl.types import Message as TelethonMessage, MessageEntityTextUrl, MessageEntityUrl, PeerChannel
+
+from src.adapter.outbound.http.repository.link_preview import HttpxLinkPreviewRepository
+from src.adapter.outbound.telegram_api.entity.message import TelegramMessageEntity
+from src.domain.entities.link import canonicalize_url, extract_urls
+from src.domain.entities.message import MessageField
+
+ARTICLE_HTML = """
+<html><head>
+<title>기본 제목</title>
+<meta property="og:title" content="삼성전자 3분기 실적">
+<meta name="description" content="영업이익 10조원 돌파">
+</head><body>본문</body></html>
+"""
+
+
+# 테스트용 DNS (그 외 호스트는 공인 IP로 조회)
+ADDRESSES = {
+    "internal.example": ["10.0.0.5"],
+    "rebind.example": ["93.184.216.34", "127.0.0.1"],
+    "other.example": ["93.184.216.34"],
+}
+
+
+async def fake_resolve(host):
+    """테스트용 호스트 IP 조회"""
+    return ADDRESSES.get(host, [host.strip("[]") if host[0].isdigit() or ":" in host else "93.184.216.34"])
+
+
+class LocalSite:
+    """링크 미리보기 테스트용 로컬 HTTP 서버 (Host 헤더 기준으로 응답하고 연결별 요청 호스트를 기록)"""
+
+    def __init__(self):
+        self.requests = []
+        self.connections = []
+        self.statuses = {}
+        self._server = None
+        self._writers = set()
+        self._lock = asyncio.Lock()
+
+    async def listen(self) -> int:
+        """처음 연결할 때 서버를 시작하고 포트 반환"""
+        async with self._lock:
+            if self._server is None:
+                self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """열린 연결과 서버 종료"""
+        for writer in self._writers:
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        """연결 하나의 요청을 keep-alive로 계속 처리"""
+        hosts = []
+        self.connections.append(hosts)
+        self._writers.add(writer)
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode()
+                request_line, *header_lines = head.split("\r\n")
+                headers = dict(line.lower().split(": ", 1) for line in header_lines if line)
+                url = f"http://{headers['host']}{request_line.split(' ')[1]}"
+                hosts.append(headers["host"])
+                self.requests.append(url)
+                writer.write(self._respond(headers["host"], httpx.URL(url).path, url))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _respond(self, host, path, url):
+        """요청 호스트/경로에 맞는 HTTP 응답 생성"""
+        status, headers, body = 404, {}, b""
+        if url in self.statuses:
+            status = self.statuses[url]
+        elif host == "short.example":
+            status, headers = 301, {"Location": "http://news.example.com/article"}
+        elif host == "evil.example":
+            status, headers = 302, {"Location": "http://169.254.169.254/latest/meta-data/"}
+        elif path == "/article":
+            status, headers, body = 200, {"Content-Type": "text/html; charset=utf-8"}, ARTICLE_HTML.encode()
+        elif path == "/image.png":
+            status, headers, body = 200, {"Content-Type": "image/png"}, b"\x89PNG"
+
+        lines = [f"HTTP/1.1 {status} X", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+class LoopbackBackend(httpcore.AnyIOBackend):
+    """검사를 통과한 IP 대신 로컬 서버로 연결하고 연결한 IP를 기록하는 네트워크 백엔드"""
+
+    def __init__(self, site):
+        self.site = site
+        self.connects = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.connects.append(host)
+        return await super().connect_tcp("127.0.0.1", await self.site.listen(), timeout, local_address)
+
+
+class TestLinkExtraction:
+    """URL 추출/정규화 단위 테스트"""
+
+    def test_extract_urls(self):
+        """본문 URL 추출 시 문장부호 제거와 중복 제거 테스트"""
+        text = "기사: https://news.example.com/a. 다시 https://news.example.com/a 그리고 http://b.example/x?y=1!"
+
+        assert extract_urls(text) == ["https://news.example.com/a", "http://b.example/x?y=1"]
+
+    def test_canonicalize_url(self):
+        """scheme/host 소문자화, 기본 포트/fragment/추적 쿼리 제거 테스트"""
+        url = "HTTPS://News.Example.com:443/a?utm_source=tg&b=2&a=1#section"
+
+        assert canonicalize_url(url) == "https://news.example.com/a?a=1&b=2"
+        assert canonicalize_url("http://example.com") == "http://example.com/"
+
+    def test_urls_from_telethon_entities(self):
+        """텍스트 링크와 scheme 없는 URL 엔티티에서 URL 추출 테스트"""
+        text = "자세히 보기 news.example.com/b https://news.example.com/a"
+        message = TelethonMessage(
+            id=1,
+            peer_id=PeerChannel(channel_id=67890),
+            date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            message=text,
+            entities=[
+                MessageEntityTextUrl(offset=0, length=2, url="https://hidden.example.com/c"),
+                MessageEntityUrl(offset=7, length=18),
+            ],
+        )
+
+        entity = TelegramMessageEntity.from_telethon(message, frozenset({MessageField.LINKS}))
+
+        assert entity.urls == (
+            "https://news.example.com/a",
+            "https://hidden.example.com/c",
+            "http://news.example.com/b",
+        )
+
+
+class TestHttpxLinkPreviewRepository:
+    """HttpxLinkPreviewRepository 단위 테스트"""
+
+    @pytest_asyncio.fixture
+    async def site(self):
+        """로컬 HTTP 서버"""
+        site = LocalSite()
+        yield site
+        await site.close()
+
+    @pytest.fixture
+    def backend(self, site):
+        """로컬 서버로 연결하는 네트워크 백엔드"""
+        return LoopbackBackend(site)
+
+    @pytest_asyncio.fixture
+    async def repository(self, backend, tmp_path):
+        """로컬 서버를 바라보는 테스트용 리포지토리 인스턴스"""
+        repository = HttpxLinkPreviewRepository(
+            str(tmp_path / "cache.json"), resolve=fake_resolve, network_backend=backend
+        )
+        yield repository
+        await repository.aclose()
+
+    @pytest.mark.asyncio
+    async def test_follows_redirect_and_parses_meta(self, repository):
+        """리다이렉트를 따라가 og 태그로 제목/설명을 만드는지 테스트"""
+        previews = await repository.fetch_previews(["http://short.example/x", "http://news.example.com/image.png"])
+
+        preview = previews["http://short.example/x"]
+        assert preview.final_url == "http://news.example.com/article"
+        assert preview.title == "삼성전자 3분기 실적"
+        assert preview.description == "영업이익 10조원 돌파"
+        assert previews["http://news.example.com/image.png"].title is None
+
+    @pytest.mark.asyncio
+    async def test_each_canonical_url_fetched_once(self, repository, site):
+        """동시 요청과 표기만 다른 URL도 한 번만 가져오는지 테스트"""
+        urls = ["http://news.example.com/article?utm_source=a", "http://NEWS.example.com/article#top"]
+
+        await asyncio.gather(repository.fetch_previews(urls), repository.fetch_previews(urls[:1]))
+        previews = await repository.fetch_previews(["http://news.example.com/article"])
+
+        assert site.requests == ["http://news.example.com/article"]
+        assert previews["http://news.example.com/article"].title == "삼성전자 3분기 실적"
+
+    @pytest.mark.asyncio
+    async def test_cache_is_persisted_and_bounded(self, site, backend, tmp_path):
+        """캐시가 파일에 저장되어 재시작 후에도 재사용되고 크기가 제한되는지 테스트"""
+        path = str(tmp_path / "cache.json")
+        first = HttpxLinkPreviewRepository(path, cache_size=1, resolve=fake_resolve, network_backend=backend)
+        await first.fetch_previews(["http://news.example.com/image.png"])
+        await first.fetch_previews(["http://news.example.com/article"])
+        await first.aclose()
+
+        second = HttpxLinkPreviewRepository(path, resolve=fake_resolve, network_backend=backend)
+        await second.fetch_previews(["http://news.example.com/article"])
+        await second.fetch_previews(["http://news.example.com/image.png"])
+        await second.aclose()
+
+        assert site.requests == [
+            "http://news.example.com/image.png",
+            "http://news.example.com/article",
+            "http://news.example.com/image.png",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cache_flushed_on_timer_and_close(self, repository, backend, tmp_path):
+        """캐시 파일은 요청마다 쓰지 않고 flush_interval마다, 그리고 종료 시 쓰는지 테스트"""
+        path = tmp_path / "cache.json"
+        await repository.fetch_previews(["http://news.example.com/article"])
+        await repository.fetch_previews(["http://news.example.com/image.png"])
+        written_before_close = path.exists()
+        await repository.aclose()
+
+        timed = HttpxLinkPreviewRepository(
+            str(tmp_path / "timed.json"), flush_interval=0, resolve=fake_resolve, network_backend=backend
+        )
+        await timed.fetch_previews(["http://news.example.com/article"])
+        await asyncio.sleep(0.05)
+        written_by_timer = (tmp_path / "timed.json").exists()
+        await timed.aclose()
+
+        assert not written_before_close
+        assert path.exists()
+        assert written_by_timer
+        assert repository._host_semaphores == {}
+
+    @pytest.mark.asyncio
+    async def test_hosts_sharing_an_address_use_separate_connections(self, repository, site, backend):
+        """같은 IP의 서로 다른 호스트는 연결을 공유하지 않고, 검사한 IP로 연결하는지 테스트"""
+        await repository.fetch_previews(["http://news.example.com/article"])
+        await repository.fetch_previews(["http://other.example/article", "http://news.example.com/image.png"])
+
+        assert backend.connects == ["93.184.216.34", "93.184.216.34"]
+        assert sorted(site.connections) == [["news.example.com", "news.example.com"], ["other.example"]]
+
+    @pytest.mark.asyncio
+    async def test_blocks_private_addresses_and_redirects(self, repository, site, backend):
+        """루프백/링크로컬/사설 주소와 그곳으로의 리다이렉트, http(s) 외 scheme은 연결하지 않는지 테스트"""
+        urls = [
+            "http://127.0.0.1:8000/admin",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://[::1]/admin",
+            "http://[::ffff:127.0.0.1]/admin",
+            "http://internal.example/admin",
+            "http://rebind.example/admin",
+            "http://evil.example/go",
+            "ftp://news.example.com/file",
+        ]
+
+        previews = await repository.fetch_previews(urls)
+
+        assert previews == {}
+        assert backend.connects == ["93.184.216.34"]
+        assert site.requests == ["http://evil.example/go"]
+
+    @pytest.mark.asyncio
+    async def test_unparsable_url_is_skipped(self, repository):
+        """해석할 수 없는 URL은 건너뛰고 나머지 미리보기는 반환하는지 테스트"""
+        previews = await repository.fetch_previews(["http://example.com:80a/", "http://news.example.com/article"])
+
+        assert list(previews) == ["http://news.example.com/article"]
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_not_cached(self, repository, site):
+        """5xx/429 응답은 캐시하지 않아 다음 요청에서 다시 가져오고, 404는 캐시하는지 테스트"""
+        urls = ["http://news.example.com/article", "http://news.example.com/limited", "http://news.example.com/gone"]
+        site.statuses = {urls[0]: 503, urls[1]: 429}
+        failed = await repository.fetch_previews(urls)
+
+        site.statuses = {}
+        recovered = await repository.fetch_previews(urls)
+
+        assert list(failed) == [urls[2]]
+        assert recovered[urls[0]].title == "삼성전자 3분기 실적"
+        assert urls[1] in recovered
+        assert site.requests.count(urls[2]) == 1
+        assert site.requests.count(urls[0]) == 2
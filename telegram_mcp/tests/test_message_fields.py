@@ -0,0 +1,156 @@
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime, timezone
+
+from telethon.errors import ChannelInvalidError
+from telethon.tl.functions.channels import GetChannelsRequest
+from telethon.tl.functions.users import GetUsersRequest
+from telethon.tl.types import Channel, ChatPhotoEmpty, InputChannel, InputPeerUser, InputUser, PeerUser, User
+from telethon.tl.types.messages import Chats
+
+from src.adapter.outbound.telegram_api.repository.message import TelegramMessageRepository
+from src.domain.entities.message import MessageField
+
+START_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
+END_TS = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+ALICE = User(id=1, username="alice", first_name="Alice")
+BOB = User(id=2, username="bob", first_name="Bob")
+SOURCE = Channel(id=555, title="원본 채널", photo=ChatPhotoEmpty(), date=None, username="source")
+
+
+class FakeTelegram:
+    """사용자/채널 일괄 조회 요청에 응답하는 Telegram API 대체 객체"""
+
+    def __init__(self, entities):
+        self.entities = {entity.id: entity for entity in entities}
+        self.requests = []
+        self.channels_error = None
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if isinstance(request, GetUsersRequest):
+            return [self.entities[user.user_id] for user in request.id if user.user_id in self.entities]
+        if self.channels_error is not None:
+            raise self.channels_error
+        return Chats(chats=[self.entities[channel.channel_id] for channel in request.id])
+
+
+class TestMessageFieldProjection:
+    """메시지 필드 선택 조회 단위 테스트"""
+
+    @pytest.fixture
+    def telegram(self, mock_telegram_client):
+        """엔티티 일괄 조회 응답 (세션에는 사용자 1만 저장되어 있음)"""
+        telegram = FakeTelegram([ALICE, BOB, SOURCE])
+        mock_telegram_client.client.side_effect = telegram
+
+        def get_input_entity(peer):
+            if peer == PeerUser(user_id=1):
+                return InputPeerUser(user_id=1, access_hash=99)
+            raise ValueError("Could not find input entity")
+
+        mock_telegram_client.client.session = MagicMock()
+        mock_telegram_client.client.session.get_input_entity.side_effect = get_input_entity
+        return telegram
+
+    @pytest.fixture
+    def repository(self, mock_telegram_client, telegram):
+        """테스트용 리포지토리 인스턴스"""
+        return TelegramMessageRepository(mock_telegram_client)
+
+    @pytest.fixture
+    def messages(self, telethon_message):
+        """발신자 2명, 전달 원본 채널 1개를 가진 메시지 목록"""
+        return [
+            telethon_message(3, from_user_id=1, fwd_channel_id=555),
+            telethon_message(2, from_user_id=2, reply_to=1),
+            telethon_message(1, from_user_id=1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_fields_skip_entity_lookup(self, repository, mock_telegram_client, messages, aiter_of):
+        """기본 조회 시 엔티티 조회 없이 기본 필드만 포함되는지 테스트"""
+        # Given
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+
+        # When
+        result = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS)
+
+        # Then
+        assert [message.id for message in result] == [3, 2, 1]
+        assert "sender_id" not in result[0].to_dict()
+        mock_telegram_client.client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rich_fields_resolve_entities_in_one_batch(
+        self, repository, mock_telegram_client, telegram, messages, aiter_of
+    ):
+        """발신자/전달 필드 요청 시 엔티티를 사용자/채널 요청 1번씩으로 조회하고 캐시하는지 테스트"""
+        # Given
+        fields = frozenset(MessageField)
+
+        # When
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+        result = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS, fields)
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+        await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS, fields)
+
+        # Then
+        assert telegram.requests == [
+            GetUsersRequest([InputUser(user_id=1, access_hash=99), InputUser(user_id=2, access_hash=0)]),
+            GetChannelsRequest([InputChannel(channel_id=555, access_hash=0)]),
+        ]
+
+        assert result[0].sender_username == "alice"
+        assert result[0].forward_from_channel == "source"
+        assert result[0].forward_ts is not None
+        assert result[1].sender_first_name == "Bob"
+        assert result[1].reply_to_message_id == 1
+        assert result[2].media_type is None
+        assert result[0].to_dict()["sender_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_peer_recorded_as_failure_and_not_cached(
+        self, repository, mock_telegram_client, telegram, messages, aiter_of
+    ):
+        """응답에 없는 peer만 실패로 기록되고, 대기 시간이 지나면 그 peer만 다시 조회하는지 테스트"""
+        # Given
+        del telegram.entities[2]
+        fields = frozenset({MessageField.SENDER, MessageField.FORWARD})
+
+        # When
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+        first = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS, fields)
+
+        repository._entity_failures.clear()  # 재조회 대기 시간 경과
+        telegram.entities[2] = BOB
+        telegram.requests.clear()
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+        second = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS, fields)
+
+        # Then
+        assert telegram.requests == [GetUsersRequest([InputUser(user_id=2, access_hash=0)])]
+        assert first[0].sender_username == "alice"
+        assert first[1].sender_username is None
+        assert second[1].sender_username == "bob"
+
+    @pytest.mark.asyncio
+    async def test_failed_request_not_retried_within_ttl(
+        self, repository, mock_telegram_client, telegram, messages, aiter_of
+    ):
+        """요청 자체가 실패한 peer는 ENTITY_FAILURE_TTL 동안 다시 조회하지 않는지 테스트"""
+        # Given
+        telegram.channels_error = ChannelInvalidError(request=None)
+        fields = frozenset({MessageField.SENDER, MessageField.FORWARD})
+
+        # When
+        for _ in range(2):
+            mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+            result = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS, fields)
+
+        # Then
+        assert [type(request) for request in telegram.requests] == [GetUsersRequest, GetChannelsRequest]
+        assert result[0].sender_username == "alice"
+        assert result[0].forward_from_channel is None
+        assert set(repository._entity_cache) == {1, 2}
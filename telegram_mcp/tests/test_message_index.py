@@ -0,0 +1,124 @@
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+
+from src.adapter.outbound.file_storage.repository.message_index import JsonMessageIndexRepository
+from src.adapter.outbound.telegram_api.repository import message as message_repository
+from src.adapter.outbound.telegram_api.repository.message import TelegramMessageRepository
+
+START_TS = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+END_TS = START_TS + timedelta(hours=3)
+PEER_ID = -10067890
+
+
+class TestJsonMessageIndexRepository:
+    """JsonMessageIndexRepository 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_record_and_get_boundaries(self, tmp_path):
+        """기록한 경계가 파일을 거쳐 다시 조회되는지 테스트"""
+        path = tmp_path / "index.json"
+        await JsonMessageIndexRepository(str(path)).record_boundaries(PEER_ID, {START_TS: 10, END_TS: 20})
+
+        index = JsonMessageIndexRepository(str(path))
+
+        assert await index.get_boundaries(PEER_ID, [START_TS, END_TS, END_TS + timedelta(hours=1)]) == {
+            START_TS: 10,
+            END_TS: 20,
+        }
+        assert await index.get_boundaries(-10012345, [START_TS]) == {}
+
+
+class TestMessageIndexSeeking:
+    """경계 인덱스를 사용한 날짜 범위 조회 단위 테스트"""
+
+    @pytest.fixture
+    def repository(self, mock_telegram_client, tmp_path):
+        """경계 인덱스를 사용하는 테스트용 리포지토리 인스턴스 (username/ID 모두 같은 peer ID로 조회)"""
+        mock_telegram_client.client.get_peer_id.return_value = PEER_ID
+        return TelegramMessageRepository(mock_telegram_client, JsonMessageIndexRepository(str(tmp_path / "index.json")))
+
+    @pytest.fixture
+    def messages(self, telethon_message):
+        """00:00 ~ 03:00 사이 메시지와 시작 이전 메시지 1개 (최신순)"""
+        return [
+            telethon_message(14, date=START_TS + timedelta(hours=2, minutes=30)),
+            telethon_message(13, date=START_TS + timedelta(hours=2)),
+            telethon_message(12, date=START_TS + timedelta(minutes=10)),
+            telethon_message(11, date=START_TS + timedelta(minutes=5)),
+            telethon_message(10, date=START_TS - timedelta(minutes=1)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_walk_records_hour_boundaries(self, repository, mock_telegram_client, messages, aiter_of):
+        """역방향 탐색 중 지나친 정시 경계가 기록되는지 테스트"""
+        # Given
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+
+        # When
+        result = await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS)
+
+        # Then
+        assert [message.id for message in result] == [14, 13, 12, 11]
+        mock_telegram_client.client.iter_messages.assert_called_once_with("@test_channel", offset_date=END_TS)
+        boundaries = [START_TS + timedelta(hours=hour) for hour in range(4)]
+        assert await repository.message_index.get_boundaries(PEER_ID, boundaries) == {
+            boundaries[0]: 10,
+            boundaries[1]: 12,
+            boundaries[2]: 12,
+            boundaries[3]: 14,
+        }
+
+    @pytest.mark.asyncio
+    async def test_indexed_range_uses_id_bounds(self, repository, mock_telegram_client, messages, aiter_of):
+        """경계가 기록된 범위는 min_id/max_id로 바로 조회하는지 테스트"""
+        # Given
+        await repository.message_index.record_boundaries(PEER_ID, {START_TS: 10, END_TS: 14})
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages[:4]))
+
+        # When
+        result = await repository.find_by_channel_and_date_range("-10067890", START_TS, END_TS)
+
+        # Then
+        assert [message.id for message in result] == [14, 13, 12, 11]
+        mock_telegram_client.client.iter_messages.assert_called_once_with("-10067890", max_id=15, min_id=10)
+
+    @pytest.mark.asyncio
+    async def test_estimate_count_probes_missing_boundaries(self, repository, mock_telegram_client, messages):
+        """기록되지 않은 경계만 조회해 메시지 수를 추정하는지 테스트"""
+        # Given
+        await repository.message_index.record_boundaries(PEER_ID, {START_TS: 10})
+        mock_telegram_client.client.get_messages.return_value = [messages[0]]
+
+        # When
+        count = await repository.estimate_count_by_channel_and_date_range("@test_channel", START_TS, END_TS)
+
+        # Then
+        assert count == 4
+        mock_telegram_client.client.get_messages.assert_called_once_with("@test_channel", limit=1, offset_date=END_TS)
+        assert await repository.message_index.get_boundaries(PEER_ID, [END_TS]) == {END_TS: 14}
+
+    @pytest.mark.asyncio
+    async def test_recent_boundaries_not_recorded(
+        self, repository, mock_telegram_client, messages, aiter_of, monkeypatch
+    ):
+        """조회 시작 시각보다 INDEX_SAFETY_MARGIN 이상 지나지 않은 경계는 기록하지 않는지 테스트"""
+
+        # Given
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return START_TS + timedelta(hours=2, minutes=3)
+
+        monkeypatch.setattr(message_repository, "datetime", FrozenDatetime)
+        mock_telegram_client.client.iter_messages = MagicMock(return_value=aiter_of(messages))
+
+        # When
+        await repository.find_by_channel_and_date_range("@test_channel", START_TS, END_TS)
+
+        # Then
+        boundaries = [START_TS + timedelta(hours=hour) for hour in range(4)]
+        assert await repository.message_index.get_boundaries(PEER_ID, boundaries) == {
+            boundaries[0]: 10,
+            boundaries[1]: 12,
+        }
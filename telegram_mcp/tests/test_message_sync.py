@@ -0,0 +1,154 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from telethon.tl.types import InputPeerChannel, UpdateDeleteChannelMessages, UpdateEditChannelMessage
+from telethon.tl.types.updates import ChannelDifference, ChannelDifferenceEmpty, ChannelDifferenceTooLong
+
+from src.adapter.inbound.web.exception_handler import register_exception_handlers
+from src.adapter.outbound.telegram_api.repository.message import TelegramMessageRepository
+from src.application.service.sync import MessageSyncService
+from src.domain.entities.sync import SyncToken
+from src.infrastructure.exception import InvalidSyncTokenError, SyncTokenExpiredError
+
+
+class TestSyncToken:
+    """SyncToken 단위 테스트"""
+
+    def test_encode_decode_roundtrip(self):
+        """인코딩한 토큰이 그대로 복원되는지 테스트"""
+        token = SyncToken(channel_id=67890, pts=1234)
+
+        assert SyncToken.decode(token.encode()) == token
+
+    def test_decode_invalid_token(self):
+        """잘못된 토큰 복원 시 예외 발생 테스트"""
+        with pytest.raises(ValueError):
+            SyncToken.decode("not-a-token")
+
+
+class TestFindChangesSince:
+    """TelegramMessageRepository 변경분 조회 단위 테스트"""
+
+    @pytest.fixture
+    def repository(self, mock_telegram_client):
+        """채널 67890을 조회하는 테스트용 리포지토리 인스턴스"""
+        mock_telegram_client.client.get_input_entity.return_value = InputPeerChannel(channel_id=67890, access_hash=1)
+        return TelegramMessageRepository(mock_telegram_client)
+
+    @pytest.mark.asyncio
+    async def test_classifies_added_edited_and_deleted(self, repository, mock_telegram_client, telethon_message):
+        """추가/수정/삭제 메시지 분류 테스트"""
+        # Given
+        edit_date = datetime(2025, 1, 1, 4, 0, 0, tzinfo=timezone.utc)
+        edited = telethon_message(5, "수정된 메시지", edit_date=edit_date)
+        added_then_edited = telethon_message(11, "새 메시지 (수정)", edit_date=edit_date)
+        mock_telegram_client.client.return_value = ChannelDifference(
+            final=True,
+            pts=20,
+            new_messages=[telethon_message(11, "새 메시지"), telethon_message(12, "곧 삭제될 메시지")],
+            other_updates=[
+                UpdateEditChannelMessage(message=edited, pts=18, pts_count=1),
+                UpdateEditChannelMessage(message=added_then_edited, pts=19, pts_count=1),
+                UpdateDeleteChannelMessages(channel_id=67890, messages=[3, 12], pts=20, pts_count=2),
+            ],
+            chats=[],
+            users=[],
+        )
+
+        # When
+        changes = await repository.find_changes_since("@test_channel", SyncToken(channel_id=67890, pts=10))
+
+        # Then
+        assert changes.token == SyncToken(channel_id=67890, pts=20)
+        assert [message.id for message in changes.added] == [11]
+        assert changes.added[0].message == "새 메시지 (수정)"
+        assert [message.id for message in changes.edited] == [5]
+        assert changes.edited[0]._edit_ts == edit_date
+        assert changes.deleted_ids == [3, 12]
+        assert changes.has_more is False
+
+    @pytest.mark.asyncio
+    async def test_empty_difference(self, repository, mock_telegram_client):
+        """변경분이 없을 때 토큰만 갱신되는지 테스트"""
+        mock_telegram_client.client.return_value = ChannelDifferenceEmpty(final=True, pts=10)
+
+        changes = await repository.find_changes_since("@test_channel", SyncToken(channel_id=67890, pts=10))
+
+        assert changes.token.pts == 10
+        assert changes.added == []
+        assert changes.edited == []
+        assert changes.deleted_ids == []
+
+    @pytest.mark.asyncio
+    async def test_too_long_difference(self, repository, mock_telegram_client):
+        """토큰이 만료되었을 때 예외 발생 테스트"""
+        mock_telegram_client.client.return_value = ChannelDifferenceTooLong(
+            dialog=None, messages=[], chats=[], users=[], final=True
+        )
+
+        with pytest.raises(SyncTokenExpiredError):
+            await repository.find_changes_since("@test_channel", SyncToken(channel_id=67890, pts=1))
+
+    @pytest.mark.asyncio
+    async def test_token_of_other_channel(self, repository):
+        """다른 채널의 토큰 사용 시 예외 발생 테스트"""
+        with pytest.raises(InvalidSyncTokenError):
+            await repository.find_changes_since("@test_channel", SyncToken(channel_id=1, pts=10))
+
+    @pytest.mark.asyncio
+    async def test_service_issues_token_without_changes(self):
+        """토큰 없이 호출 시 현재 토큰만 발급되는지 테스트"""
+        message_repository = AsyncMock()
+        message_repository.get_sync_token.return_value = SyncToken(channel_id=67890, pts=30)
+
+        changes = await MessageSyncService(message_repository).get_changes("@test_channel")
+
+        assert changes.token == SyncToken(channel_id=67890, pts=30)
+        assert changes.added == []
+        message_repository.find_changes_since.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_service_rejects_malformed_token(self):
+        """형식이 잘못된 토큰은 조회 없이 InvalidSyncTokenError로 변환되는지 테스트"""
+        message_repository = AsyncMock()
+
+        with pytest.raises(InvalidSyncTokenError):
+            await MessageSyncService(message_repository).get_changes("@test_channel", "garbage")
+        message_repository.find_changes_since.assert_not_called()
+
+
+class TestSyncExceptionHandlers:
+    """동기화 예외의 HTTP 응답 변환 단위 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """동기화 예외를 발생시키는 라우트를 가진 테스트용 앱 클라이언트"""
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/invalid")
+        async def invalid():
+            raise InvalidSyncTokenError("잘못된 동기화 토큰입니다: garbage")
+
+        @app.get("/expired")
+        async def expired():
+            raise SyncTokenExpiredError("동기화 토큰이 만료되었습니다.")
+
+        return TestClient(app)
+
+    def test_invalid_token_is_bad_request(self, client):
+        """InvalidSyncTokenError가 400 ErrorResponse로 변환되는지 테스트"""
+        response = client.get("/invalid")
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "InvalidSyncTokenError", "message": "잘못된 동기화 토큰입니다: garbage"}
+
+    def test_expired_token_is_gone(self, client):
+        """SyncTokenExpiredError가 410 ErrorResponse로 변환되는지 테스트"""
+        response = client.get("/expired")
+
+        assert response.status_code == 410
+        assert response.json()["error"] == "SyncTokenExpiredError"
@@ -0,0 +1,170 @@
+import pytest
+import random
+from unittest.mock import AsyncMock
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from src.adapter.outbound.minhash.near_duplicate import MinHashNearDuplicateIndex
+from src.application.service.message import MessageService
+from src.domain.entities.message import Message
+
+NEWS = "삼성전자, 3분기 영업이익 10조원 돌파… 시장 예상치 상회 https://news.example.com/1"
+OTHER = "완전히 다른 내용의 메시지입니다. 오늘 코스피는 보합 마감했습니다."
+
+
+def _message(message_id, text, peer_id=67890, minutes=0):
+    """테스트용 도메인 메시지 생성"""
+    return Message(
+        id=message_id,
+        message=text,
+        peer_name="PeerChannel",
+        peer_id=peer_id,
+        _ts=datetime(2025, 1, 1, 3, 0, 0, tzinfo=timezone.utc) + timedelta(minutes=minutes),
+    )
+
+
+class TestMinHashNearDuplicateIndex:
+    """MinHashNearDuplicateIndex 단위 테스트"""
+
+    def test_near_duplicates_share_cluster(self):
+        """유사 중복 메시지는 같은 클러스터, 다른 메시지는 다른 클러스터로 묶이는지 테스트"""
+        index = MinHashNearDuplicateIndex()
+
+        result = index.assign_clusters(
+            [_message(1, NEWS), _message(2, f"{NEWS} (속보)"), _message(3, OTHER), _message(4, "짧은 글")]
+        )
+
+        assert result[0].cluster_id == result[1].cluster_id
+        assert result[2].cluster_id != result[0].cluster_id
+        assert result[3].cluster_id is None
+
+    def test_cluster_across_batches_and_channels(self):
+        """이전 배치와 다른 채널의 메시지도 같은 클러스터로 묶이고, 같은 메시지는 같은 ID를 받는지 테스트"""
+        index = MinHashNearDuplicateIndex()
+        first = index.assign_clusters([_message(1, NEWS)])
+
+        second = index.assign_clusters([_message(7, f"[속보] {NEWS}", peer_id=1), _message(1, NEWS)])
+
+        assert second[0].cluster_id == first[0].cluster_id
+        assert second[1].cluster_id == first[0].cluster_id
+
+    def test_capacity_bounds_index(self):
+        """인덱스 크기가 capacity를 넘지 않고, 밀려난 메시지는 더 이상 매칭되지 않는지 테스트"""
+        index = MinHashNearDuplicateIndex(capacity=2)
+        first = index.assign_clusters([_message(1, NEWS)])
+
+        index.assign_clusters([_message(2, OTHER), _message(3, OTHER + " 외국인 순매도 지속")])
+        again = index.assign_clusters([_message(4, NEWS)])
+
+        assert index._size == 2
+        assert len(index._seen) == 2
+        assert again[0].cluster_id != first[0].cluster_id
+        assert first[0].cluster_id not in index._representatives
+
+    def test_lsh_finds_pairs_above_threshold(self):
+        """추정 유사도가 threshold 이상인 쌍이 LSH 후보 단계에서 빠지지 않고 95% 이상 같은 클러스터로 묶이는지 테스트"""
+        rng = random.Random(0)
+        alphabet = "가나다라마바사아자차카타파하abcdefghij "
+        index = MinHashNearDuplicateIndex()
+        pairs = []
+        for _ in range(200):
+            original = [rng.choice(alphabet) for _ in range(200)]
+            edited = list(original)
+            for _ in range(rng.randint(2, 8)):
+                edited[rng.randrange(len(edited))] = rng.choice(alphabet)
+            pairs.append(("".join(original), "".join(edited)))
+
+        similar = [
+            (original, edited)
+            for original, edited in pairs
+            if np.mean(index._signatures_of([original])[0] == index._signatures_of([edited])[0]) >= index.threshold
+        ]
+        clustered = 0
+        for n, (original, edited) in enumerate(similar):
+            first = index.assign_clusters([_message(2 * n, original)])
+            second = index.assign_clusters([_message(2 * n + 1, edited, peer_id=1)])
+            clustered += first[0].cluster_id == second[0].cluster_id
+
+        assert len(similar) > 100
+        assert clustered >= 0.95 * len(similar)
+
+    def test_lookup_checks_every_slot_with_equal_band_key(self):
+        """같은 밴드 키를 가진 슬롯이 여러 개면 모두 후보로 조회되는지 테스트"""
+        index = MinHashNearDuplicateIndex(capacity=4, num_perm=4, bands=2)
+        signatures = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 9, 9, 9]], dtype=np.uint32)
+        band_keys = np.array([[10, 20], [10, 30], [40, 50]], dtype=np.uint64)
+        index._insert([(1, 1), (1, 2), (1, 3)], signatures, band_keys, np.array([1, 2, 3]))
+
+        starts, ends = index._lookup(np.array([[10, 99]], dtype=np.uint64))
+
+        assert index._candidates(index._sorted_slots, starts[0], ends[0]).tolist() == [0, 1]
+
+    def test_incremental_index_matches_full_rebuild(self):
+        """링 버퍼가 여러 번 순환해도 증분 갱신한 정렬 인덱스가 전체 재구성 결과와 같은지 테스트"""
+        rng = random.Random(1)
+        index = MinHashNearDuplicateIndex(capacity=50)
+        for batch in range(7):
+            index.assign_clusters(
+                [
+                    _message(batch * 20 + n, "".join(rng.choice("가나다라마바사 abc") for _ in range(40)), minutes=n)
+                    for n in range(20)
+                ]
+            )
+
+        expected = sorted((int(key), slot) for slot in range(index._size) for key in index._band_keys[slot].tolist())
+        actual = list(zip(index._sorted_keys.tolist(), index._sorted_slots.tolist(), strict=True))
+
+        assert index._size == 50
+        assert np.all(np.diff(index._sorted_keys.astype(np.float64)) >= 0)
+        assert sorted(actual) == expected
+
+
+class TestMessageServiceDedupe:
+    """MessageService 중복 제거 단위 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_dedupe_drops_reposts_seen_in_other_channel(self):
+        """다른 채널에서 먼저 조회된 메시지의 재게시는 dedupe 시 제외되는지 테스트"""
+        # Given
+        message_repository = AsyncMock()
+        service = MessageService(message_repository, MinHashNearDuplicateIndex())
+        message_repository.find_by_channel_and_date_range.return_value = [_message(1, NEWS, peer_id=1)]
+        from_a = await service.get_messages_by_date("@a", date(2025, 1, 1), dedupe=True)
+
+        # When
+        message_repository.find_by_channel_and_date_range.return_value = [
+            _message(9, f"[속보] {NEWS}", peer_id=2, minutes=5),
+            _message(8, OTHER, peer_id=2),
+        ]
+        all_from_b = await service.get_messages_by_date("@b", date(2025, 1, 1))
+        deduped_from_b = await service.get_messages_by_date("@b", date(2025, 1, 1), dedupe=True)
+        message_repository.find_by_channel_and_date_range.return_value = [_message(1, NEWS, peer_id=1)]
+        again_from_a = await service.get_messages_by_date("@a", date(2025, 1, 1), dedupe=True)
+
+        # Then
+        assert [message.id for message in from_a] == [1]
+        assert all_from_b[0].cluster_id == from_a[0].cluster_id
+        assert [message.id for message in deduped_from_b] == [8]
+        assert [message.id for message in again_from_a] == [1]
+
+    @pytest.mark.asyncio
+    async def test_dedupe_keeps_oldest_per_cluster(self):
+        """dedupe 시 클러스터별로 가장 오래된 메시지만 남는지 테스트"""
+        # Given
+        message_repository = AsyncMock()
+        message_repository.find_by_channel_and_date_range.return_value = [
+            _message(3, f"{NEWS} (속보)", minutes=2),
+            _message(2, OTHER, minutes=1),
+            _message(1, NEWS, minutes=0),
+        ]
+        service = MessageService(message_repository, MinHashNearDuplicateIndex())
+
+        # When
+        all_messages = await service.get_messages_by_date("@test_channel", date(2025, 1, 1))
+        deduped = await service.get_messages_by_date("@test_channel", date(2025, 1, 1), dedupe=True)
+
+        # Then
+        assert [message.id for message in all_messages] == [3, 2, 1]
+        assert all(message.cluster_id is not None for message in all_messages)
+        assert [message.id for message in deduped] == [2, 1]